@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+build_graph Benchmark
+=====================
+Compares the vectorized build_graph against the previous two-pass
+iterrows implementation on synthetic requirement matrices.
+
+Usage:
+    python benchmarks/bench_build_graph.py
+    python benchmarks/bench_build_graph.py --sizes 1000 10000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import networkx as nx
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from requirements_interactive import build_graph, parse_dependency_column  # noqa: E402
+
+AREAS = ['Ingesta', 'Extracción', 'Modelo de datos', 'Métricas', 'Backtest', 'UI/UX', 'Seguridad']
+PRIORITIES = ['Alta (P0)', 'Media (P1)', 'Baja (P2)']
+VERSIONS = ['MVP v0.1', 'v0.2', 'v0.3', 'v1.0']
+
+
+def synthetic_requirements(n_rows: int, max_deps: int = 4, seed: int = 42) -> pd.DataFrame:
+    """Requirements frame in the CSV schema, with parsed_deps already filled in."""
+    rng = random.Random(seed)
+    ids = [f'RM-{i:03d}' for i in range(1, n_rows + 1)]
+    rows = []
+    for i, req_id in enumerate(ids):
+        deps = sorted({ids[rng.randrange(i)] for _ in range(rng.randint(0, max_deps))}) if i else []
+        rows.append({
+            'ID': req_id,
+            'Área': rng.choice(AREAS),
+            'Funcionalidad': f'Funcionalidad {i}',
+            # Mix of short, long (truncated) and missing text
+            'Requisito_detallado': None if i % 17 == 0 else 'El sistema deberá ' + 'procesar datos ' * rng.randint(2, 40),
+            'Prioridad': None if i % 23 == 0 else rng.choice(PRIORITIES),
+            'Roles': 'Admin; Sistema',
+            'Estatus': 'BACKLOG',
+            'Versión_objetivo': rng.choice(VERSIONS),
+            'Owner': 'Backend',
+            'Dependencias': ', '.join(deps) if deps else '—',
+            'parsed_deps': deps,
+        })
+    return pd.DataFrame(rows)
+
+
+def build_graph_iterrows(df: pd.DataFrame) -> nx.DiGraph:
+    """Previous implementation, kept here as the benchmark baseline."""
+    G = nx.DiGraph()
+
+    for _, row in df.iterrows():
+        requisito = str(row['Requisito_detallado']) if pd.notna(row['Requisito_detallado']) else 'N/A'
+        if len(requisito) > 300:
+            requisito = requisito[:300] + '...'
+
+        G.add_node(
+            row['ID'],
+            area=row['Área'] if pd.notna(row['Área']) else 'Unknown',
+            funcionalidad=row['Funcionalidad'] if pd.notna(row['Funcionalidad']) else 'N/A',
+            requisito=requisito,
+            prioridad=row['Prioridad'] if pd.notna(row['Prioridad']) else 'Media (P1)',
+            estatus=row['Estatus'] if pd.notna(row['Estatus']) else 'N/A',
+            version=row['Versión_objetivo'] if pd.notna(row['Versión_objetivo']) else 'N/A',
+            owner=row['Owner'] if pd.notna(row['Owner']) else 'N/A',
+            roles=row['Roles'] if pd.notna(row['Roles']) else 'N/A',
+            dependencias=row['Dependencias'] if pd.notna(row['Dependencias']) else '—',
+        )
+
+    for _, row in df.iterrows():
+        for dep in row['parsed_deps']:
+            if dep in G.nodes:
+                G.add_edge(dep, row['ID'])
+
+    return G
+
+
+def best_of(func, df: pd.DataFrame, repeat: int) -> tuple:
+    """Best wall time over ``repeat`` runs, plus the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark build_graph against the iterrows baseline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000], help='Row counts')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}  {'iterrows (s)':>12}  {'vectorized (s)':>14}  {'speedup':>8}")
+    for n_rows in args.sizes:
+        df = synthetic_requirements(n_rows)
+        # Both sides start from already-parsed dependencies
+        dependencies = parse_dependency_column(df)
+        old_time, old_graph = best_of(build_graph_iterrows, df, args.repeat)
+        new_time, new_graph = best_of(lambda frame: build_graph(frame, dependencies), df, args.repeat)
+
+        if (list(old_graph.nodes(data=True)) != list(new_graph.nodes(data=True))
+                or list(old_graph.edges()) != list(new_graph.edges())):
+            sys.exit(f'build_graph output differs from the baseline at {n_rows} rows')
+
+        print(f'{n_rows:>8}  {old_time:>12.3f}  {new_time:>14.3f}  {old_time / new_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
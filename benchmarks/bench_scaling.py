@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Scaling Benchmark Suite
+=======================
+Times every pipeline stage on synthetic matrices (see generate_matrix.py)
+at increasing sizes and stores the results as JSON, so runs on different
+commits can be compared.
+
+Stages: load_requirements (pandas), load_requirement_rows (stdlib csv),
+parse_dependency_column, build_graph, condensation,
+calculate_hierarchical_levels, tree_layout (compute_layered_layout),
+detect_cycles, closure (ReachabilityIndex), force_layout
+(compute_force_layout, used by --precompute-layout), search_index
+(build_search_index) and emit_html (streaming the page to a file). The
+closure is skipped above --closure-limit nodes, where pages use the
+adjacency payload instead.
+
+Usage:
+    python benchmarks/bench_scaling.py --output results.json
+    python benchmarks/bench_scaling.py --sizes 100 1000 --compare results.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import networkx as nx
+# Loaded up front so the first timed stage does not pay for lazy imports
+import pandas  # noqa: F401
+import pyvis.network  # noqa: F401
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from generate_matrix import COLUMNS, generate_matrix, write_csv  # noqa: E402
+from requirements_interactive import (  # noqa: E402
+    ReachabilityIndex, analyze_graph, build_graph, build_search_index, calculate_hierarchical_levels,
+    compute_force_layout, compute_layered_layout, detect_cycles, iter_page, load_requirement_rows,
+    load_requirements, parse_dependency_column, write_chunks,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def best_of(func, repeat: int) -> tuple:
+    """Best wall time over ``repeat`` calls, plus the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_size(n_rows: int, args: argparse.Namespace, workdir: Path) -> dict:
+    csv_path = workdir / f'matrix_{n_rows}.csv'
+    rows, _ = generate_matrix(n_rows, depth=args.depth, fan_in=args.fan_in,
+                              range_fraction=args.range_fraction, cycles=args.cycles, seed=args.seed)
+    write_csv(csv_path, rows, COLUMNS)
+
+    stages = {}
+
+    def stage(name, func):
+        stages[name], result = best_of(func, args.repeat)
+        print(f'  {name:<30} {stages[name]:>9.3f}s', flush=True)
+        return result
+
+    print(f'{n_rows} rows:')
+    df = stage('load_requirements', lambda: load_requirements(str(csv_path)))
+    stage('load_requirement_rows', lambda: load_requirement_rows(str(csv_path)))
+    dependencies = stage('parse_dependency_column', lambda: parse_dependency_column(df))
+    G = stage('build_graph', lambda: build_graph(df, dependencies))
+    condensation = stage('condensation', lambda: nx.condensation(G))
+    levels = stage('calculate_hierarchical_levels', lambda: calculate_hierarchical_levels(G, condensation))
+    stage('tree_layout', lambda: compute_layered_layout(G, levels))
+    stage('detect_cycles', lambda: detect_cycles(G, condensation=condensation))
+
+    with_closure = G.number_of_nodes() <= args.closure_limit
+    if with_closure:
+        stage('closure', lambda: ReachabilityIndex(G, condensation))
+    stage('force_layout', lambda: compute_force_layout(G))
+    stage('search_index', lambda: build_search_index(G))
+
+    analysis = analyze_graph(G, reachability=with_closure)
+    page = workdir / 'page.html'
+
+    def emit():
+        with open(page, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            write_chunks(f, iter_page(G, analysis=analysis, subgraph_mode='auto' if with_closure else 'adjacency'))
+
+    stage('emit_html', emit)
+    return {
+        'nodes': G.number_of_nodes(),
+        'edges': G.number_of_edges(),
+        'csv_bytes': csv_path.stat().st_size,
+        'html_bytes': page.stat().st_size,
+        'stages': stages,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta: float) -> int:
+    """Print per-stage ratios against ``baseline``; returns the number of regressions.
+
+    A stage regresses when it is more than ``tolerance`` times slower and
+    at least ``min_delta`` seconds slower, so timer noise on tiny stages is
+    not reported.
+    """
+    regressions = 0
+    print(f"\nCompared with {baseline['meta'].get('commit', '?')} ({baseline['meta'].get('timestamp', '?')}):")
+    print(f"{'rows':>8}  {'stage':<30} {'before (s)':>10} {'after (s)':>10} {'ratio':>7}")
+    for size, result in results.items():
+        before = baseline['results'].get(size)
+        if before is None:
+            continue
+        for name, seconds in result['stages'].items():
+            old = before['stages'].get(name)
+            if old is None:
+                continue
+            ratio = seconds / old if old else float('inf')
+            flag = '  REGRESSION' if ratio > tolerance and seconds - old >= min_delta else ''
+            regressions += bool(flag)
+            print(f'{size:>8}  {name:<30} {old:>10.3f} {seconds:>10.3f} {ratio:>6.2f}x{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every pipeline stage at increasing matrix sizes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000, 100_000], help='Row counts')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per stage (best is reported)')
+    parser.add_argument('--depth', type=int, default=12, help='Dependency layers of the synthetic matrices')
+    parser.add_argument('--fan-in', type=int, default=3, help='Maximum dependencies per requirement')
+    parser.add_argument('--range-fraction', type=float, default=0.1, help='Share of range dependency cells')
+    parser.add_argument('--cycles', type=int, default=5, help='Dependency cycles to inject')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--closure-limit', type=int, default=20_000,
+                        help='Skip the closure stage above this many nodes (default: 20000)')
+    parser.add_argument('--output', '-o', help='Write results to this JSON file')
+    parser.add_argument('--compare', metavar='BASELINE_JSON', help='Compare against an earlier results file')
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='Slowdown ratio reported as a regression with --compare (default: 1.25)')
+    parser.add_argument('--min-delta', type=float, default=0.05,
+                        help='Ignore slowdowns smaller than this many seconds with --compare (default: 0.05)')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in args.sizes:
+            results[str(n_rows)] = run_size(n_rows, args, Path(tmp))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'networkx': nx.__version__,
+            'args': vars(args),
+        },
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f'\nResults written to {args.output}')
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        if compare(results, baseline, args.tolerance, args.min_delta):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+=================
+Measures interpreter-start-to-exit time of requirements_interactive.py for
+--help, for rendering the ~55-row sample matrix and for a build-cache hit
+on it, and uses ``python -X importtime`` to check which heavy modules each
+run imports.
+
+Exits with status 1 when a run imports a module it should not (e.g. pandas
+on the small-file path, or anything heavy on a cache hit) or exceeds
+--max-seconds, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 5 --max-seconds 3
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / 'requirements_interactive.py'
+SAMPLE_CSV = ROOT / 'requirements_matrix_v3_2_es_schema_updated_myfxbook_metatrader.csv'
+SAMPLE_GANTT = ROOT / 'gantt_timelines_sample.csv'
+HEAVY_MODULES = ('pandas', 'numpy', 'networkx', 'pyvis', 'IPython')
+
+
+def scenarios(output: Path) -> list:
+    """(name, CLI arguments, modules that must not be imported).
+
+    The cache-hit scenario uses a fresh cache next to ``output``; ``main``
+    fills it with one untimed run first.
+    """
+    render = [str(SAMPLE_CSV), '-g', str(SAMPLE_GANTT), '-o', str(output), '--no-daemon']
+    return [
+        ('--help', ['--help'], HEAVY_MODULES),
+        ('render (stdlib csv)', render + ['--no-cache', '--csv-engine', 'auto'], ('pandas',)),
+        ('render (pandas)', render + ['--no-cache', '--csv-engine', 'pandas'], ()),
+        ('render (cache hit)', render + ['--cache-dir', str(output.parent / 'cache')], HEAVY_MODULES),
+    ]
+
+
+def run_once(args: list, importtime: bool = False) -> tuple:
+    """Wall time of one run and, with ``importtime``, {module: cumulative µs}."""
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + [str(SCRIPT)] + args
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(f'{" ".join(args)} failed:\n{result.stdout}{result.stderr}')
+
+    imports = {}
+    if importtime:
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and '|' in line:
+                _, cumulative, name = line.split('|')
+                if cumulative.strip().isdigit():
+                    imports[name.strip()] = int(cumulative)
+    return elapsed, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark requirements_interactive.py startup')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per scenario (best is reported)')
+    parser.add_argument('--max-seconds', type=float,
+                        help='Fail if the stdlib-csv render takes longer than this (best of --repeat)')
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'scenario':<22}  {'best (s)':>8}  {'imports (ms)':>12}  heavy modules imported")
+        for name, cli_args, forbidden in scenarios(Path(tmp) / 'out.html'):
+            if name == 'render (cache hit)':
+                run_once(cli_args)
+            _, imports = run_once(cli_args, importtime=True)
+            best = min(run_once(cli_args)[0] for _ in range(args.repeat))
+
+            heavy = [m for m in HEAVY_MODULES if m in imports]
+            total_ms = sum(us for module, us in imports.items() if '.' not in module) / 1000
+            print(f'{name:<22}  {best:>8.3f}  {total_ms:>12.0f}  {", ".join(heavy) or "-"}')
+
+            unexpected = [m for m in forbidden if m in imports]
+            if unexpected:
+                failures.append(f'{name} imported {", ".join(unexpected)}')
+            if args.max_seconds is not None and name.startswith('render (stdlib') and best > args.max_seconds:
+                failures.append(f'{name} took {best:.3f}s (limit {args.max_seconds}s)')
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Synthetic Requirements Matrix Generator
+=======================================
+Writes requirement CSVs in the same schema as the sample matrices (every
+column, ``RM-NNN`` IDs, ``Dependencias`` lists and ``RM-a..RM-b`` ranges),
+plus an optional Gantt timeline CSV, for scaling tests.
+
+Requirements are split into ``depth`` layers in ID order and depend only
+on earlier layers (each has at least one dependency in the previous one,
+so the longest chain spans every layer). ``cycles`` back references are
+then added, each closing a loop through a dependency chain.
+
+Usage:
+    python benchmarks/generate_matrix.py --nodes 10000 -o matrix_10k.csv
+    python benchmarks/generate_matrix.py --nodes 1000 --depth 12 --fan-in 5 \\
+        --range-fraction 0.2 --cycles 5 --gantt gantt_1k.csv -o matrix_1k.csv
+"""
+
+import argparse
+import csv
+import random
+from datetime import date, timedelta
+
+COLUMNS = [
+    'ID', 'Área', 'Funcionalidad', 'Requisito_detallado', 'Prioridad', 'Roles', 'Pantallas_UI',
+    'Entidades_dominio', 'Tablas_DB_sugeridas', 'Storage_sugerido', 'API_sugerida', 'Integraciones',
+    'Reglas_validación', 'Auditoría_bitácora', 'Notificaciones', 'Pruebas_sugeridas',
+    'Criterios_aceptación', 'Dependencias', 'Estatus', 'Versión_objetivo', 'Owner',
+]
+AREAS = ['Ingesta', 'Extracción', 'Modelo de datos', 'Transformación', 'Métricas', 'Backtest',
+         'UI/UX', 'Seguridad', 'Observabilidad', 'Performance']
+PRIORITIES = ['Alta (P0)', 'Media (P1)', 'Baja (P2)']
+STATUSES = ['BACKLOG', 'EN PROGRESO', 'HECHO']
+VERSIONS = ['MVP v0.1', 'v0.2', 'v0.3', 'v1.0']
+OWNERS = ['Backend', 'Frontend', 'Backend/DevOps', 'Backend/Quant', 'Quant', 'Data']
+ROLES = ['Admin; Sistema', 'Analista; Sistema', 'Admin; Analista; Sistema', 'Sistema']
+WORDS = ('el sistema deberá procesar validar registrar exponer calcular métricas fuentes datos '
+         'históricos reportes auditoría trazabilidad configurable incremental por trader').split()
+GANTT_SCENARIOS = [('Optimista', 1.0), ('Realista', 1.4), ('Pesimista', 2.0)]
+
+
+def requirement_id(i: int) -> str:
+    return f'RM-{i:03d}'
+
+
+def sentence(rng: random.Random, n_words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + '.'
+
+
+def generate_dependencies(n_nodes: int, depth: int, fan_in: int, range_fraction: float,
+                          cycles: int, rng: random.Random) -> tuple:
+    """Dependency cells per requirement (1-based) and the layer of each one."""
+    depth = max(1, min(depth, n_nodes))
+    layer_of = [i * depth // n_nodes for i in range(n_nodes)]
+    layer_start = {}
+    for i, layer in enumerate(layer_of):
+        layer_start.setdefault(layer, i)
+
+    deps = [[] for _ in range(n_nodes)]
+    parents = [[] for _ in range(n_nodes)]
+    for i in range(n_nodes):
+        layer = layer_of[i]
+        if layer == 0:
+            continue
+        prev_start, prev_end = layer_start[layer - 1], layer_start[layer]
+        # Early layers may have fewer candidates than the fan-in
+        n_deps = min(rng.randint(1, max(1, fan_in)), prev_end)
+        if rng.random() < range_fraction:
+            # A contiguous run of the previous layer, written as RM-a..RM-b
+            first = rng.randrange(prev_start, prev_end)
+            last = min(prev_end - 1, first + n_deps - 1)
+            deps[i].append(f'{requirement_id(first + 1)}..{requirement_id(last + 1)}')
+            parents[i] = list(range(first, last + 1))
+            continue
+        chosen = {rng.randrange(prev_start, prev_end)}
+        while len(chosen) < n_deps:
+            chosen.add(rng.randrange(0, prev_end))
+        parents[i] = sorted(chosen)
+        deps[i].extend(requirement_id(d + 1) for d in parents[i])
+
+    # Each cycle: walk up from a deep requirement, then make the ancestor depend on it
+    candidates = [i for i in range(n_nodes) if layer_of[i] > 0]
+    for _ in range(cycles if candidates else 0):
+        start = rng.choice(candidates)
+        node = start
+        for _ in range(rng.randint(1, 4)):
+            if not parents[node]:
+                break
+            node = rng.choice(parents[node])
+        if node != start:
+            deps[node].append(requirement_id(start + 1))
+
+    return deps, layer_of
+
+
+def generate_matrix(n_nodes: int, depth: int = 8, fan_in: int = 3, range_fraction: float = 0.1,
+                    cycles: int = 0, seed: int = 42) -> tuple:
+    """Rows (dicts keyed by COLUMNS) and the layer of each requirement."""
+    rng = random.Random(seed)
+    deps, layer_of = generate_dependencies(n_nodes, depth, fan_in, range_fraction, cycles, rng)
+    rows = []
+    for i in range(n_nodes):
+        area = rng.choice(AREAS)
+        rows.append({
+            'ID': requirement_id(i + 1),
+            'Área': area,
+            'Funcionalidad': f'{area}: {sentence(rng, 4)[:-1]} {i + 1}',
+            'Requisito_detallado': sentence(rng, rng.randint(10, 90)),
+            'Prioridad': rng.choice(PRIORITIES),
+            'Roles': rng.choice(ROLES),
+            'Pantallas_UI': f'Admin > {area}',
+            'Entidades_dominio': sentence(rng, 3)[:-1],
+            'Tablas_DB_sugeridas': '; '.join(rng.sample(WORDS, 2)),
+            'Storage_sugerido': '—',
+            'API_sugerida': f'GET/POST /{area.lower().replace(" ", "-")}/{i + 1}',
+            'Integraciones': '—',
+            'Reglas_validación': sentence(rng, 8),
+            'Auditoría_bitácora': f'{rng.choice(WORDS)}_updated',
+            'Notificaciones': '—',
+            'Pruebas_sugeridas': 'Unit; Integration',
+            'Criterios_aceptación': sentence(rng, 12),
+            'Dependencias': ','.join(deps[i]) if deps[i] else '—',
+            'Estatus': rng.choice(STATUSES),
+            'Versión_objetivo': VERSIONS[min(len(VERSIONS) - 1, layer_of[i] * len(VERSIONS) // max(depth, 1))],
+            'Owner': rng.choice(OWNERS),
+        })
+    return rows, layer_of
+
+
+def gantt_scenarios(count: int) -> list:
+    """``(name, stretch)`` of ``count`` timeline versions: the named ones, then ``Escenario-<n>``."""
+    extra = [(f'Escenario-{n}', 1.0 + (n - 1) % 11 / 10) for n in range(len(GANTT_SCENARIOS) + 1, count + 1)]
+    return (GANTT_SCENARIOS + extra)[:count]
+
+
+def generate_gantt(rows: list, layer_of: list, scenarios: int = 3, seed: int = 42) -> list:
+    """Timeline rows: each layer starts after the previous one, stretched per scenario."""
+    rng = random.Random(seed)
+    start = date(2025, 1, 6)
+    timeline = []
+    for name, stretch in gantt_scenarios(scenarios):
+        for row, layer in zip(rows, layer_of):
+            begin = start + timedelta(days=round(layer * 14 * stretch + rng.randint(0, 5)))
+            end = begin + timedelta(days=round(rng.randint(3, 20) * stretch))
+            timeline.append({
+                'requirement_id': row['ID'],
+                'version': name,
+                'start_date': begin.isoformat(),
+                'end_date': end.isoformat(),
+                'progress': rng.choice([0, 0, 25, 50, 100]),
+            })
+    return timeline
+
+
+def write_csv(path: str, rows: list, columns: list):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic requirements matrix CSV')
+    parser.add_argument('--nodes', '-n', type=int, default=1000, help='Number of requirements')
+    parser.add_argument('--depth', type=int, default=8, help='Number of dependency layers')
+    parser.add_argument('--fan-in', type=int, default=3, help='Maximum dependencies per requirement')
+    parser.add_argument('--range-fraction', type=float, default=0.1,
+                        help='Share of dependency cells written as RM-a..RM-b ranges')
+    parser.add_argument('--cycles', type=int, default=0, help='Dependency cycles to inject')
+    parser.add_argument('--gantt', help='Also write a Gantt timeline CSV to this path')
+    parser.add_argument('--gantt-scenarios', type=int, default=3,
+                        help='Timeline versions to generate: Optimista, Realista, Pesimista, '
+                             'then Escenario-4, Escenario-5, ...')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', '-o', default='synthetic_requirements.csv', help='Output CSV file')
+    args = parser.parse_args()
+    if args.gantt_scenarios < 1:
+        parser.error('--gantt-scenarios must be at least 1')
+
+    rows, layer_of = generate_matrix(args.nodes, args.depth, args.fan_in, args.range_fraction,
+                                     args.cycles, args.seed)
+    write_csv(args.output, rows, COLUMNS)
+    print(f'Wrote {len(rows)} requirements to {args.output}')
+    if args.gantt:
+        timeline = generate_gantt(rows, layer_of, args.gantt_scenarios, args.seed)
+        write_csv(args.gantt, timeline, ['requirement_id', 'version', 'start_date', 'end_date', 'progress'])
+        print(f'Wrote {len(timeline)} timeline rows to {args.gantt}')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,15 +11,35 @@ Creates an interactive HTML visualization with:
 - Data table showing visible requirements
 """
 
-import pandas as pd
-import networkx as nx
-from pyvis.network import Network
+from __future__ import annotations
+
 import re
 import json
+import hashlib
+import math
+import pickle
+import os
+import shutil
+import sys
+import time
+import tempfile
+import traceback
+import unicodedata
+import contextlib
+import io
+import socket
+import socketserver
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TextIO
 import argparse
 
+# pandas, NumPy, networkx and pyvis are imported by the stages that need
+# them, so --help, cache hits and daemon clients start without them
+if TYPE_CHECKING:
+    import networkx as nx
+    import pandas as pd
+    from pyvis.network import Network
+
 
 # Color palette for areas
 AREA_COLORS = {
@@ -60,27 +80,205 @@ PRIORITY_SIZES = {
     'Baja (P2)': 18,
 }
 
+# How ancestor/descendant data reaches the page:
+# - closure: precomputed ancestor/descendant lists per node (O(N²) worst case)
+# - adjacency: compact forward/backward adjacency, traversed in the browser
+# - auto: closure unless it would exceed AUTO_CLOSURE_LIMIT node references
+SUBGRAPH_MODES = ('auto', 'closure', 'adjacency')
+AUTO_CLOSURE_LIMIT = 200_000
+
+# Node attribute -> (CSV column, default when the cell is empty)
+NODE_COLUMNS = {
+    'area': ('Área', 'Unknown'),
+    'funcionalidad': ('Funcionalidad', 'N/A'),
+    'requisito': ('Requisito_detallado', 'N/A'),
+    'prioridad': ('Prioridad', 'Media (P1)'),
+    'estatus': ('Estatus', 'N/A'),
+    'version': ('Versión_objetivo', 'N/A'),
+    'owner': ('Owner', 'N/A'),
+    'roles': ('Roles', 'N/A'),
+    'dependencias': ('Dependencias', '—'),
+}
+REQUISITO_MAX_LEN = 300
+
+# Page search index: text is folded (NFD, combining accents removed,
+# lower-cased) and split into runs of letters and digits, the same way in
+# Python and in the page. Postings pack the fields a term occurs in as
+# bits (1 ID, 2 funcionalidad, 4 requisito) below SEARCH_FIELD_BITS
+SEARCH_ACCENTS = re.compile('[\u0300-\u036f]')
+SEARCH_TOKEN = re.compile(r'[^\W_]+')
+SEARCH_FIELD_BITS = 8
+
+# Node attributes the page's filters select on -> default when missing
+FACET_FIELDS = {
+    'area': 'Unknown',
+    'prioridad': 'Media (P1)',
+    'version': 'N/A',
+    'estatus': 'N/A',
+    'owner': 'N/A',
+}
+
+# Precomputed force layout (--precompute-layout): node repulsion is exact up
+# to LAYOUT_EXACT_LIMIT nodes and approximated on a grid of at most
+# LAYOUT_GRID_MAX² cells above; positions are scaled to about LAYOUT_SPACING
+# pixels per node and then kept LAYOUT_MIN_DISTANCE pixels apart (the
+# largest node is 35 px in radius)
+DEFAULT_LAYOUT_ITERATIONS = 100
+LAYOUT_EXACT_LIMIT = 500
+LAYOUT_GRID_MAX = 256
+LAYOUT_GRAVITY = 1.0
+LAYOUT_SPACING = 150
+LAYOUT_MIN_DISTANCE = 80
+
+# Layered tree layout: spacing in pixels between levels and between
+# neighbouring nodes (or points where long edges cross a level), and the
+# number of alternating ordering/positioning sweeps. Edges spanning more
+# than TREE_MAX_SPAN levels are left out of the ordering (and drawn straight)
+# so long range dependencies do not multiply the number of vertices
+TREE_LEVEL_SEPARATION = 150
+TREE_NODE_SPACING = 180
+TREE_DUMMY_SPACING = 30
+TREE_SWEEPS = 8
+TREE_MAX_SPAN = 8
+
+# Digest of this script's source as loaded. Long-running processes (the
+# render daemon, --watch) keep using it after the file is edited, so their
+# output is never filed under the new code's digest
+SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+# Build cache: generated pages keyed by a digest of their inputs
+CACHE_DIR_ENV = 'REQVIZ_CACHE_DIR'
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'requirements-viz'
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_MAX_AGE_DAYS = 30
+# CLI arguments that do not change the generated page (input files are hashed by content)
+NON_CONTENT_ARGS = {'csv_file', 'gantt', 'output', 'no_cache', 'cache_dir', 'daemon', 'no_daemon', 'daemon_socket',
+                    'batch', 'jobs', 'profile', 'profile_json', 'profile_stats'}
+
+# CSV loading: pandas, or the stdlib csv module for files up to
+# CSV_FAST_PATH_MAX_BYTES ('auto'), where importing pandas costs more than parsing
+CSV_ENGINES = ('auto', 'stdlib', 'pandas')
+CSV_FAST_PATH_MAX_BYTES = 1024 * 1024
+# Cells pandas.read_csv reads as missing by default
+CSV_NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+})
+
+# Watch mode: input polling, save-burst debounce and the live reload endpoint
+WATCH_POLL_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.5
+DEFAULT_RELOAD_PORT = 35729
+
+# Render daemon: jobs are sent over a Unix socket to a warm process
+DAEMON_SOCKET_ENV = 'REQVIZ_SOCKET'
+DAEMON_SOCKET_NAME = 'requirements-viz.sock'
+
+# pyvis template directory -> shared Jinja environment (see iter_page)
+TEMPLATE_ENVIRONMENTS = {}
+
+# Folders of pyvis' templates/lib that pages with cdn_resources='local' load
+PYVIS_BUNDLES = ('bindings', 'tom-select', 'vis-9.1.2')
+
+# A dependency reference: a single ID (RM-012) or an inclusive range (RM-001..RM-049)
+DEPENDENCY_PATTERN = re.compile(r'RM-(?P<start>\d+)(?:\s*\.\.\s*RM-(?P<end>\d+))?')
+
 
 def parse_dependencies(dep_str: str) -> List[str]:
     """Parse dependency string into list of requirement IDs."""
-    if pd.isna(dep_str) or dep_str == '—' or dep_str.strip() == '':
+    if not isinstance(dep_str, str) or dep_str == '—' or dep_str.strip() == '':
         return []
 
-    # Handle ranges like RM-001..RM-049
-    range_match = re.match(r'RM-(\d+)\.\.RM-(\d+)', dep_str)
-    if range_match:
-        start, end = int(range_match.group(1)), int(range_match.group(2))
-        return [f'RM-{i:03d}' for i in range(start, end + 1)]
-
-    deps = re.findall(r'RM-\d+', dep_str)
+    deps = []
+    for match in DEPENDENCY_PATTERN.finditer(dep_str):
+        if match.group('end') is None:
+            deps.append(f"RM-{match.group('start')}")
+        else:
+            # Handle ranges like RM-001..RM-049
+            start, end = int(match.group('start')), int(match.group('end'))
+            deps.extend(f'RM-{i:03d}' for i in range(start, end + 1))
     return deps
 
 
+def parse_dependency_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse the whole Dependencias column into an edge table.
+
+    Every cell may mix single IDs and ranges (``RM-001..RM-010; RM-020``).
+    Returns one row per dependency with columns ``source`` (the required ID),
+    ``target`` (the requirement that depends on it) and ``kind`` (``'list'``
+    or ``'range'``), in cell order and without duplicate pairs.
+    """
+    import numpy as np
+    import pandas as pd
+    matches = df['Dependencias'].astype(object).str.extractall(DEPENDENCY_PATTERN)
+    if matches.empty:
+        return pd.DataFrame({'source': [], 'target': [], 'kind': []}, dtype=object)
+
+    is_range = matches['end'].notna().to_numpy()
+    start = matches['start'].astype(int).to_numpy()
+    end = matches['end'].fillna(matches['start']).astype(int).to_numpy()
+
+    # Expand each match to (end - start + 1) IDs; reversed ranges yield nothing
+    counts = np.clip(end - start + 1, 0, None)
+    match_pos = np.repeat(np.arange(len(matches)), counts)
+    offsets = np.arange(len(match_pos)) - np.repeat(np.cumsum(counts) - counts, counts)
+    numbers = start[match_pos] + offsets
+
+    ranged_ids = 'RM-' + pd.Series(numbers).astype(str).str.zfill(3)
+    # Single references keep their original spelling (RM-1 stays RM-1)
+    single_ids = ('RM-' + matches['start']).to_numpy()[match_pos]
+    from_range = is_range[match_pos]
+    row_pos = df.index.get_indexer(matches.index.get_level_values(0))[match_pos]
+
+    edges = pd.DataFrame({
+        'source': np.where(from_range, ranged_ids.to_numpy(dtype=object), single_ids),
+        'target': df['ID'].to_numpy()[row_pos],
+        'kind': np.where(from_range, 'range', 'list'),
+    })
+    return edges.drop_duplicates(['source', 'target'], ignore_index=True)
+
+
 def load_requirements(csv_path: str) -> pd.DataFrame:
     """Load requirements from CSV file."""
-    df = pd.read_csv(csv_path)
-    df['parsed_deps'] = df['Dependencias'].apply(parse_dependencies)
-    return df
+    import pandas as pd
+    return pd.read_csv(csv_path)
+
+
+def use_stdlib_csv(csv_path: str, engine: str = 'auto') -> bool:
+    """Whether ``engine`` selects the stdlib CSV loaders for ``csv_path``."""
+    if engine == 'auto':
+        return os.path.getsize(csv_path) <= CSV_FAST_PATH_MAX_BYTES
+    return engine == 'stdlib'
+
+
+def read_csv_rows(csv_path: str) -> List[dict]:
+    """Rows of a CSV file as dicts, with cells pandas treats as missing set to None."""
+    import csv
+
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        return [
+            {column: None if value is None or value in CSV_NA_VALUES else value for column, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
+
+
+def load_requirement_rows(csv_path: str) -> List[dict]:
+    """``load_requirements`` without pandas: one dict per CSV row.
+
+    Cells are kept as text (missing ones are None), so the graph matches the
+    pandas path for the text columns of the requirements schema.
+    """
+    return read_csv_rows(csv_path)
+
+
+def parse_dependency_rows(rows: List[dict]) -> List[tuple]:
+    """``(source, target)`` pairs from each row's Dependencias cell, in row
+    order and without duplicates, like ``parse_dependency_column``."""
+    pairs = {}
+    for row in rows:
+        for dep in parse_dependencies(row['Dependencias']):
+            pairs[dep, row['ID']] = None
+    return list(pairs)
 
 
 def load_gantt_timelines(csv_path: str) -> tuple:
@@ -94,107 +292,780 @@ def load_gantt_timelines(csv_path: str) -> tuple:
     - progress: Optional percentage complete (0-100)
 
     Returns: (gantt_data_by_version, list_of_versions)
+
+    Rows whose dates cannot be parsed, or that end before they start, are
+    skipped with a warning. Dates are normalised to YYYY-MM-DD.
     """
+    import numpy as np
+    import pandas as pd
     df = pd.read_csv(csv_path)
 
     # Determine versions available
     if 'version' in df.columns:
         versions = df['version'].unique().tolist()
+        version_keys = df['version']
     else:
         versions = ['Default']
+        version_keys = pd.Series('Default', index=df.index)
+
+    # Parse and validate all dates at once
+    start = pd.to_datetime(df['start_date'], format='ISO8601', errors='coerce')
+    end = pd.to_datetime(df['end_date'], format='ISO8601', errors='coerce')
+    invalid = start.isna() | end.isna() | (end < start)
+    if invalid.any():
+        bad_rows = [
+            f"{req_id} (line {pos + 2})"
+            for pos, req_id in zip(invalid.to_numpy().nonzero()[0], df.loc[invalid, 'requirement_id'])
+        ]
+        shown = ', '.join(bad_rows[:10]) + (', ...' if len(bad_rows) > 10 else '')
+        print(f"Warning: skipped {len(bad_rows)} Gantt row(s) with invalid dates: {shown}")
+
+    valid = ~invalid
+    if 'progress' in df.columns:
+        progress = pd.to_numeric(df['progress'], errors='coerce').fillna(0).astype(int)
+    else:
+        progress = pd.Series(0, index=df.index)
+
+    entries = np.empty(int(valid.sum()), dtype=object)
+    entries[:] = [
+        {'start_date': s, 'end_date': e, 'progress': p}
+        for s, e, p in zip(
+            start[valid].dt.strftime('%Y-%m-%d').tolist(),
+            end[valid].dt.strftime('%Y-%m-%d').tolist(),
+            progress[valid].tolist(),
+        )
+    ]
+    req_ids = df.loc[valid, 'requirement_id'].to_numpy(dtype=object)
+
+    # One grouping pass; later rows for the same requirement win
+    gantt_data = {version: {} for version in versions}
+    valid_versions = version_keys[valid]
+    for version, positions in valid_versions.groupby(valid_versions, sort=False).indices.items():
+        gantt_data[version] = dict(zip(req_ids[positions], entries[positions]))
+
+    return gantt_data, versions
 
-    gantt_data = {}
-    for version in versions:
-        gantt_data[version] = {}
-        if 'version' in df.columns:
-            version_df = df[df['version'] == version]
-        else:
-            version_df = df
-
-        for _, row in version_df.iterrows():
-            req_id = row['requirement_id']
-            gantt_data[version][req_id] = {
-                'start_date': row['start_date'],
-                'end_date': row['end_date'],
-                'progress': int(row['progress']) if 'progress' in row and pd.notna(row['progress']) else 0
-            }
+
+def load_gantt_rows(csv_path: str) -> tuple:
+    """``load_gantt_timelines`` without pandas, for small timeline files."""
+    from datetime import datetime
+
+    rows = read_csv_rows(csv_path)
+    has_versions = bool(rows) and 'version' in rows[0]
+    versions = list(dict.fromkeys(row['version'] for row in rows)) if has_versions else ['Default']
+
+    def parse_date(value):
+        try:
+            return datetime.fromisoformat(value.strip())
+        except (AttributeError, ValueError):
+            return None
+
+    def parse_progress(value):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return 0
+        return int(number) if math.isfinite(number) else 0
+
+    gantt_data = {version: {} for version in versions}
+    bad_rows = []
+    for pos, row in enumerate(rows):
+        start, end = parse_date(row['start_date']), parse_date(row['end_date'])
+        if start is None or end is None or end < start:
+            bad_rows.append(f"{row['requirement_id']} (line {pos + 2})")
+            continue
+        # Later rows for the same requirement win
+        gantt_data[row['version'] if has_versions else 'Default'][row['requirement_id']] = {
+            'start_date': start.strftime('%Y-%m-%d'),
+            'end_date': end.strftime('%Y-%m-%d'),
+            'progress': parse_progress(row.get('progress')),
+        }
+
+    if bad_rows:
+        shown = ', '.join(bad_rows[:10]) + (', ...' if len(bad_rows) > 10 else '')
+        print(f"Warning: skipped {len(bad_rows)} Gantt row(s) with invalid dates: {shown}")
 
     return gantt_data, versions
 
 
-def build_graph(df: pd.DataFrame) -> nx.DiGraph:
-    """Build directed graph from requirements dataframe."""
+def build_node_attributes(df: pd.DataFrame) -> pd.DataFrame:
+    """Column-wise node attributes: NA defaults filled and long text truncated."""
+    import pandas as pd
+    attrs = pd.DataFrame(
+        {attr: df[column].fillna(default) for attr, (column, default) in NODE_COLUMNS.items()},
+        index=df.index,
+    )
+
+    # Truncate long text for display
+    requisito = attrs['requisito'].astype(str)
+    too_long = requisito.str.len() > REQUISITO_MAX_LEN
+    attrs['requisito'] = requisito.mask(too_long, requisito.str.slice(0, REQUISITO_MAX_LEN) + '...')
+    return attrs
+
+
+def build_graph(df: pd.DataFrame, dependencies: Optional[pd.DataFrame] = None) -> nx.DiGraph:
+    """Build directed graph from requirements dataframe.
+
+    ``dependencies`` is the edge table from ``parse_dependency_column``;
+    it is computed from the Dependencias column when not given.
+    """
+    import networkx as nx
+    if dependencies is None:
+        dependencies = parse_dependency_column(df)
+
     G = nx.DiGraph()
 
-    for _, row in df.iterrows():
-        # Truncate long text for display
-        requisito = str(row['Requisito_detallado']) if pd.notna(row['Requisito_detallado']) else 'N/A'
-        if len(requisito) > 300:
-            requisito = requisito[:300] + '...'
-
-        G.add_node(
-            row['ID'],
-            area=row['Área'] if pd.notna(row['Área']) else 'Unknown',
-            funcionalidad=row['Funcionalidad'] if pd.notna(row['Funcionalidad']) else 'N/A',
-            requisito=requisito,
-            prioridad=row['Prioridad'] if pd.notna(row['Prioridad']) else 'Media (P1)',
-            estatus=row['Estatus'] if pd.notna(row['Estatus']) else 'N/A',
-            version=row['Versión_objetivo'] if pd.notna(row['Versión_objetivo']) else 'N/A',
-            owner=row['Owner'] if pd.notna(row['Owner']) else 'N/A',
-            roles=row['Roles'] if pd.notna(row['Roles']) else 'N/A',
-            dependencias=row['Dependencias'] if pd.notna(row['Dependencias']) else '—',
-        )
+    attrs = build_node_attributes(df)
+    names = list(attrs.columns)
+    records = (dict(zip(names, values)) for values in zip(*(attrs[c].tolist() for c in names)))
+    G.add_nodes_from(zip(df['ID'].tolist(), records))
 
-    for _, row in df.iterrows():
-        for dep in row['parsed_deps']:
-            if dep in G.nodes:
-                G.add_edge(dep, row['ID'])
+    # Drop references to unknown IDs
+    edges = dependencies[dependencies['source'].isin(set(G.nodes))]
+    G.add_edges_from(zip(edges['source'].tolist(), edges['target'].tolist()))
 
     return G
 
 
-def calculate_hierarchical_levels(G: nx.DiGraph) -> dict:
+def build_graph_from_rows(rows: List[dict], dependencies: Optional[List[tuple]] = None) -> nx.DiGraph:
+    """``build_graph`` for rows from ``load_requirement_rows``, without pandas.
+
+    ``dependencies`` are the pairs from ``parse_dependency_rows``.
+    """
+    import networkx as nx
+
+    if dependencies is None:
+        dependencies = parse_dependency_rows(rows)
+
+    G = nx.DiGraph()
+    for row in rows:
+        attrs = {}
+        for attr, (column, default) in NODE_COLUMNS.items():
+            value = row[column]
+            attrs[attr] = default if value is None else value
+        if len(attrs['requisito']) > REQUISITO_MAX_LEN:
+            attrs['requisito'] = attrs['requisito'][:REQUISITO_MAX_LEN] + '...'
+        G.add_node(row['ID'], **attrs)
+
+    # Drop references to unknown IDs
+    G.add_edges_from((source, target) for source, target in dependencies if source in G)
+    return G
+
+
+def calculate_hierarchical_levels(G: nx.DiGraph, condensation: Optional[nx.DiGraph] = None) -> dict:
     """Calculate proper hierarchical levels for tree layout.
 
     Root nodes (no incoming edges) get level=0.
     Each child gets level = max(parent_levels) + 1.
     This ensures proper top-down hierarchy in tree visualization.
+
+    Cycles are handled by levelling the SCC condensation (``nx.condensation``,
+    reused when passed in): all members of a cycle share one level and levels
+    are longest paths on the condensation DAG, so the result is deterministic
+    and computed in O(V+E).
     """
-    levels = {}
+    import networkx as nx
+    C = condensation if condensation is not None else nx.condensation(G)
 
-    # Handle cycles gracefully - use try/except for topological sort
-    try:
-        for node in nx.topological_sort(G):
-            predecessors = list(G.predecessors(node))
-            if not predecessors:
-                levels[node] = 0  # Root nodes at level 0 (top)
-            else:
-                levels[node] = max(levels.get(pred, 0) for pred in predecessors) + 1
-    except nx.NetworkXUnfeasible:
-        # Graph has cycles - fall back to BFS from roots
-        roots = [n for n in G.nodes() if G.in_degree(n) == 0]
-        if not roots:
-            # No roots found, pick node with lowest in_degree
-            roots = [min(G.nodes(), key=lambda n: G.in_degree(n))]
-
-        visited = set()
-        queue = [(r, 0) for r in roots]
-        while queue:
-            node, level = queue.pop(0)
-            if node in visited:
-                continue
-            visited.add(node)
-            levels[node] = max(levels.get(node, 0), level)
-            for successor in G.successors(node):
-                if successor not in visited:
-                    queue.append((successor, level + 1))
+    component_levels = [0] * len(C)
+    for component in nx.topological_sort(C):
+        predecessors = C.pred[component]
+        if predecessors:
+            component_levels[component] = max(component_levels[p] for p in predecessors) + 1
+
+    mapping = C.graph['mapping']
+    return {node: component_levels[mapping[node]] for node in G.nodes()}
+
+
+def detect_cycles(
+    G: nx.DiGraph,
+    max_cycles: int = 10,
+    time_budget: float = 2.0,
+    condensation: Optional[nx.DiGraph] = None,
+) -> dict:
+    """Find dependency cycles using strongly connected components.
+
+    Cycle membership is exact and computed in O(V+E): a node is in a cycle
+    when its SCC has more than one member or it has a self-loop. Concrete
+    cycles are enumerated lazily inside each cyclic SCC; at most
+    ``max_cycles`` are kept, and counting stops once ``time_budget`` seconds
+    have elapsed. A precomputed ``nx.condensation(G)`` may be passed in to
+    reuse its components.
+
+    Returns a dict with ``in_cycle`` (set of node IDs), ``cycles`` (list of
+    node ID lists), ``cycle_count`` (number of cycles found) and
+    ``truncated`` (True if enumeration stopped before all cycles were seen).
+    """
+    import networkx as nx
+    if condensation is not None:
+        components = (data['members'] for _, data in condensation.nodes(data=True))
+    else:
+        components = nx.strongly_connected_components(G)
+
+    cyclic_components = []
+    in_cycle = set()
+    for component in components:
+        if len(component) > 1:
+            cyclic_components.append(component)
+            in_cycle.update(component)
+        else:
+            node = next(iter(component))
+            if G.has_edge(node, node):
+                cyclic_components.append(component)
+                in_cycle.add(node)
+
+    nodes = list(G.nodes())
+    position = {n: i for i, n in enumerate(nodes)}
+    cycles = []
+    cycle_count = 0
+    truncated = False
+    deadline = time.perf_counter() + time_budget
+    for component in cyclic_components:
+        # simple_cycles' search order follows set iteration, which for string
+        # IDs changes with hash randomization; enumerate over row positions
+        # so the same cycles are found on every run
+        subgraph = nx.DiGraph()
+        subgraph.add_edges_from(
+            (position[u], position[v])
+            for u in sorted(component, key=position.__getitem__) for v in G.successors(u) if v in component
+        )
+        for positions in nx.simple_cycles(subgraph):
+            cycle = [nodes[k] for k in positions]
+            cycle_count += 1
+            if len(cycles) < max_cycles:
+                # Rotate so the cycle starts at its earliest row for stable output
+                start = min(range(len(cycle)), key=lambda k: position[cycle[k]])
+                cycles.append(cycle[start:] + cycle[:start])
+            if time.perf_counter() > deadline:
+                truncated = True
+                break
+        if truncated:
+            break
+
+    return {
+        'in_cycle': in_cycle,
+        'cycles': cycles,
+        'cycle_count': cycle_count,
+        'truncated': truncated,
+    }
 
-        # Assign level 0 to any unvisited nodes
-        for node in G.nodes():
-            if node not in levels:
-                levels[node] = 0
 
-    return levels
+class ReachabilityIndex:
+    """Transitive closure of a dependency graph stored as integer bitsets.
+
+    The closure is computed in one pass over a topological order of the SCC
+    condensation: each component's descendant set is the union of its
+    successors' members and descendants (ancestors likewise, in reverse).
+    Bit ``i`` of every set refers to ``nodes[i]``, so membership tests and
+    counts are constant-time bit operations and node lists are decoded with
+    NumPy. Results match ``nx.ancestors``/``nx.descendants``: a node is never
+    its own ancestor or descendant.
+    """
+
+    def __init__(self, G: nx.DiGraph, condensation: Optional[nx.DiGraph] = None):
+        import networkx as nx
+        C = condensation if condensation is not None else nx.condensation(G)
+        self._index_components(G, C)
+        order = list(nx.topological_sort(C))
+        self._ancestors = self._propagate(order, C.predecessors)
+        self._descendants = self._propagate(reversed(order), C.successors)
+
+    def _index_components(self, G: nx.DiGraph, C: nx.DiGraph):
+        self.nodes = list(G.nodes())
+        self.index = {n: i for i, n in enumerate(self.nodes)}
+
+        mapping = C.graph['mapping']
+        self._component = [mapping[n] for n in self.nodes]
+
+        self._members = [0] * len(C)
+        for i, comp in enumerate(self._component):
+            self._members[comp] |= 1 << i
+        self._cyclic = []
+        for c in range(len(C)):
+            members = C.nodes[c]['members']
+            self._cyclic.append(len(members) > 1 or any(G.has_edge(n, n) for n in members))
+
+    def _propagate(self, order: Iterable[int], neighbours, reuse: Optional[dict] = None) -> list:
+        """Closure bitsets per component, folding ``neighbours`` in ``order``.
+
+        Components in ``reuse`` take the given bitset instead of being recomputed.
+        """
+        reuse = reuse or {}
+        sets = [0] * len(self._members)
+        for c in order:
+            bits = reuse.get(c)
+            if bits is None:
+                bits = 0
+                for p in neighbours(c):
+                    bits |= self._members[p] | sets[p]
+            sets[c] = bits
+        return sets
+
+    def updated(self, G: nx.DiGraph, changed_edges: Iterable[tuple],
+                condensation: Optional[nx.DiGraph] = None) -> tuple:
+        """Index for ``G``, an edit of this index's graph with the same node list.
+
+        A node's descendants can only change if it reaches the source of a
+        changed edge, before or after the edit (ancestors likewise, from the
+        target), so only those components are recomputed; every other closure
+        is copied over. Returns ``(index, stale)`` where ``stale`` is the set of
+        nodes whose ancestors or descendants may differ from this index.
+        """
+        import networkx as nx
+        changed_edges = list(changed_edges)
+        index = ReachabilityIndex.__new__(ReachabilityIndex)
+        C = condensation if condensation is not None else nx.condensation(G)
+        index._index_components(G, C)
+        if index.nodes != self.nodes:
+            raise ValueError('updated() requires the same nodes in the same order')
+
+        stale_desc = index._stale_components(self, self._ancestors, G.predecessors,
+                                             {u for u, _ in changed_edges})
+        stale_anc = index._stale_components(self, self._descendants, G.successors,
+                                            {v for _, v in changed_edges})
+        order = list(nx.topological_sort(C))
+        index._ancestors = index._propagate(
+            order, C.predecessors, index._carry_over(self, self._ancestors, stale_anc))
+        index._descendants = index._propagate(
+            reversed(order), C.successors, index._carry_over(self, self._descendants, stale_desc))
+
+        stale_bits = 0
+        for c in stale_desc | stale_anc:
+            stale_bits |= index._members[c]
+        return index, set(index._decode(stale_bits))
+
+    def _stale_components(self, previous: 'ReachabilityIndex', previous_sets: list, walk, seeds: set) -> set:
+        """Components of ``seeds`` and of every node linked to them through ``walk``
+        in the new graph or through ``previous_sets`` in the old one."""
+        seen = set(seeds)
+        stack = list(seeds)
+        while stack:
+            for m in walk(stack.pop()):
+                if m not in seen:
+                    seen.add(m)
+                    stack.append(m)
+        for s in seeds:
+            seen.update(previous._decode(previous._closure_bits(previous_sets, s)))
+        return {self._component[self.index[n]] for n in seen}
+
+    def _carry_over(self, previous: 'ReachabilityIndex', previous_sets: list, stale: set) -> dict:
+        """Closure bitsets of ``previous`` for every component not in ``stale``.
+
+        Such components have the same members as before, so any member
+        identifies the matching old component."""
+        reuse = {}
+        for c, members in enumerate(self._members):
+            if c not in stale:
+                first = (members & -members).bit_length() - 1
+                reuse[c] = previous_sets[previous._component[first]]
+        return reuse
+
+    def _closure_bits(self, sets: list, node) -> int:
+        i = self.index[node]
+        comp = self._component[i]
+        bits = sets[comp]
+        if self._cyclic[comp]:
+            bits |= self._members[comp] & ~(1 << i)
+        return bits
+
+    def _decode(self, bits: int) -> List[str]:
+        import numpy as np
+        if not bits:
+            return []
+        if bits.bit_count() <= 64:
+            # Sparse sets: peeling the lowest bit beats unpacking the whole bitset
+            result = []
+            while bits:
+                low = bits & -bits
+                result.append(self.nodes[low.bit_length() - 1])
+                bits ^= low
+            return result
+        raw = np.frombuffer(bits.to_bytes((len(self.nodes) + 7) // 8, 'little'), dtype=np.uint8)
+        positions = np.flatnonzero(np.unpackbits(raw, bitorder='little'))
+        return [self.nodes[i] for i in positions]
+
+    def ancestors(self, node) -> List[str]:
+        """Nodes that ``node`` depends on, directly or transitively."""
+        return self._decode(self._closure_bits(self._ancestors, node))
+
+    def descendants(self, node) -> List[str]:
+        """Nodes that depend on ``node``, directly or transitively."""
+        return self._decode(self._closure_bits(self._descendants, node))
+
+    def ancestor_count(self, node) -> int:
+        return self._closure_bits(self._ancestors, node).bit_count()
+
+    def descendant_count(self, node) -> int:
+        return self._closure_bits(self._descendants, node).bit_count()
+
+    def is_ancestor(self, ancestor, node) -> bool:
+        return bool(self._closure_bits(self._ancestors, node) >> self.index[ancestor] & 1)
+
+
+def compute_force_layout(G: nx.DiGraph, iterations: int = DEFAULT_LAYOUT_ITERATIONS, seed: int = 0) -> dict:
+    """Force-directed node positions for ``G`` as ``{node: (x, y)}`` in pixels.
+
+    Uses the forces of vis.js' forceAtlas2Based solver, which pages run in
+    the browser otherwise: linear attraction along edges, repulsion of
+    ``(deg(u) + 1)(deg(v) + 1) / distance`` between every pair of nodes and
+    gravity towards the centre, with each step capped by a cooling
+    temperature. Repulsion is approximated on a grid for large graphs (see
+    ``grid_repulsion``), and a final pass pushes apart nodes that would
+    overlap. The result only depends on ``G`` and ``seed``.
+    """
+    import numpy as np
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v], dtype=np.intp).reshape(-1, 2)
+    sources, targets = edges[:, 0], edges[:, 1]
+    mass = (np.bincount(sources, minlength=n) + np.bincount(targets, minlength=n) + 1).astype(float)
+
+    radius = math.sqrt(n)
+    pos = np.random.default_rng(seed).uniform(-radius / 2, radius / 2, (n, 2))
+    if n > LAYOUT_EXACT_LIMIT:
+        size = min(LAYOUT_GRID_MAX, max(64, 1 << math.ceil(math.log2(radius))))
+        kernels = repulsion_kernels(size)
+    temperature = radius / 10
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        if n > LAYOUT_EXACT_LIMIT:
+            disp = grid_repulsion(pos, mass, size, kernels)
+        else:
+            disp = exact_repulsion(pos, mass)
+        pull = pos[sources] - pos[targets]
+        for axis in (0, 1):
+            disp[:, axis] += (np.bincount(targets, weights=pull[:, axis], minlength=n)
+                              - np.bincount(sources, weights=pull[:, axis], minlength=n))
+        disp -= LAYOUT_GRAVITY * mass[:, None] * pos
+        length = np.maximum(np.sqrt(np.einsum('ij,ij->i', disp, disp)), 1e-9)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    # Same average room per node at every graph size, then no overlaps
+    pos -= pos.mean(axis=0)
+    area = float(np.prod(np.maximum(pos.max(axis=0) - pos.min(axis=0), 1e-9)))
+    pos *= LAYOUT_SPACING / math.sqrt(area / n)
+    separate_nodes(pos, LAYOUT_MIN_DISTANCE)
+    return dict(zip(nodes, map(tuple, np.rint(pos).astype(np.int64).tolist())))
+
+
+def exact_repulsion(pos, mass):
+    """Repulsion on every node from every other node, in row blocks."""
+    import numpy as np
+    n = len(pos)
+    disp = np.empty_like(pos)
+    x, y = pos[:, 0], pos[:, 1]
+    block = max(1, (1 << 21) // n)
+    for start in range(0, n, block):
+        dx = x[start:start + block, None] - x
+        dy = y[start:start + block, None] - y
+        weight = dx * dx + dy * dy
+        np.maximum(weight, 1e-4, out=weight)
+        np.reciprocal(weight, out=weight)
+        weight[np.arange(len(dx)), np.arange(start, start + len(dx))] = 0
+        weight *= mass
+        disp[start:start + block, 0] = (dx * weight).sum(axis=1)
+        disp[start:start + block, 1] = (dy * weight).sum(axis=1)
+    return disp * mass[:, None]
+
+
+def repulsion_kernels(size: int) -> tuple:
+    """FFTs of the x/y repulsion field of a unit mass on a zero-padded ``size``² grid."""
+    import numpy as np
+    offsets = np.fft.fftfreq(2 * size, 1 / (2 * size))
+    ox, oy = np.meshgrid(offsets, offsets, indexing='ij')
+    distance2 = ox ** 2 + oy ** 2
+    distance2[0, 0] = np.inf
+    return np.fft.rfft2(ox / distance2), np.fft.rfft2(oy / distance2)
+
+
+def grid_repulsion(pos, mass, size: int, kernels: tuple):
+    """Approximate ``exact_repulsion`` in O(N + size² log size).
+
+    Node masses are spread bilinearly onto a grid over the bounding box and
+    convolved with the repulsion field by FFT, and the resulting field is
+    interpolated back at each node. Nodes sharing a grid cell are also
+    pushed away from the centroid of their cell mates, which the grid
+    cannot resolve.
+    """
+    import numpy as np
+    low = pos.min(axis=0)
+    spacing = max(float((pos.max(axis=0) - low).max()), 1e-9) / (size - 1)
+    grid_pos = (pos - low) / spacing
+    cell = np.minimum(np.floor(grid_pos).astype(np.intp), size - 2)
+    frac = grid_pos - cell
+    corners = []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            weight = (frac[:, 0] if dx else 1 - frac[:, 0]) * (frac[:, 1] if dy else 1 - frac[:, 1])
+            corners.append(((cell[:, 0] + dx) * size + cell[:, 1] + dy, weight))
+
+    density = np.zeros(size * size)
+    for flat, weight in corners:
+        density += np.bincount(flat, weights=weight * mass, minlength=size * size)
+    spectrum = np.fft.rfft2(density.reshape(size, size), s=(2 * size, 2 * size))
+    disp = np.zeros_like(pos)
+    for axis, kernel in enumerate(kernels):
+        field = np.fft.irfft2(spectrum * kernel, s=(2 * size, 2 * size))[:size, :size].ravel() / spacing
+        for flat, weight in corners:
+            disp[:, axis] += field[flat] * weight
+
+    nearest = np.rint(grid_pos).astype(np.intp)
+    flat = nearest[:, 0] * (size + 1) + nearest[:, 1]
+    mates = np.bincount(flat, weights=mass)[flat] - mass
+    crowded = mates > 0
+    moments = np.stack([np.bincount(flat, weights=pos[:, axis] * mass)[flat] for axis in (0, 1)], axis=1)
+    centroid = (moments[crowded] - pos[crowded] * mass[crowded, None]) / mates[crowded, None]
+    delta = pos[crowded] - centroid
+    distance2 = np.maximum(np.einsum('ij,ij->i', delta, delta), (spacing / 4) ** 2)
+    disp[crowded] += delta * (mates[crowded] / distance2)[:, None]
+    return disp * mass[:, None]
+
+
+def close_pairs(pos, distance: float) -> tuple:
+    """Index pairs ``(i, j)``, ``i < j``, of nodes closer than ``distance``,
+    with their offsets and distances; found by hashing nodes into cells of
+    that size and comparing neighbouring cells only."""
+    import numpy as np
+    cell = np.floor(pos / distance).astype(np.int64)
+    cell -= cell.min(axis=0)
+    stride = int(cell[:, 1].max()) + 3
+    key = (cell[:, 0] + 1) * stride + cell[:, 1] + 1
+    order = np.argsort(key, kind='stable')
+    sorted_keys = key[order]
+    firsts, seconds = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            target = key + dx * stride + dy
+            start = np.searchsorted(sorted_keys, target, 'left')
+            counts = np.searchsorted(sorted_keys, target, 'right') - start
+            i = np.repeat(np.arange(len(pos)), counts)
+            within = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+            j = order[np.repeat(start, counts) + within]
+            firsts.append(i[i < j])
+            seconds.append(j[i < j])
+    i, j = np.concatenate(firsts), np.concatenate(seconds)
+    delta = pos[i] - pos[j]
+    dist = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+    close = dist < distance
+    return i[close], j[close], delta[close], dist[close]
+
+
+def separate_nodes(pos, distance: float, rounds: int = 20):
+    """Move overlapping nodes apart in place until none are closer than
+    ``distance`` (or ``rounds`` passes have been made)."""
+    import numpy as np
+    for _ in range(rounds):
+        i, j, delta, dist = close_pairs(pos, distance)
+        if len(i) == 0:
+            return
+        coincident = dist < 1e-9
+        delta[coincident] = (1.0, 0.0)
+        dist[coincident] = 1.0
+        push = delta * ((distance - dist) / (2 * dist))[:, None]
+        for axis in (0, 1):
+            pos[:, axis] += (np.bincount(i, weights=push[:, axis], minlength=len(pos))
+                             - np.bincount(j, weights=push[:, axis], minlength=len(pos)))
+
+
+def layer_segments(G: nx.DiGraph, levels: dict, max_span: int = TREE_MAX_SPAN) -> tuple:
+    """Split the downward edges of ``G`` into segments between adjacent levels.
+
+    An edge spanning ``k`` levels becomes a chain through ``k - 1`` dummy
+    vertices, numbered after the real ones (``0..N-1`` in ``G.nodes()``
+    order). Edges within one level (between members of a cycle) and edges
+    spanning more than ``max_span`` levels are left out. Returns ``(nodes, vertex_level, upper, lower)``, where segment
+    ``s`` runs from vertex ``upper[s]`` down to ``lower[s]``.
+    """
+    import numpy as np
+    nodes = list(G.nodes())
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    level = np.array([levels[node] for node in nodes], dtype=np.int64)
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+    span = level[edges[:, 1]] - level[edges[:, 0]]
+    kept = (span > 0) & (span <= max_span)
+    sources, targets, span = edges[kept, 0], edges[kept, 1], span[kept]
+
+    extra = span - 1
+    first_dummy = n + np.cumsum(extra) - extra
+    dummy_edge = np.repeat(np.arange(len(span)), extra)
+    dummy_step = np.arange(int(extra.sum())) - np.repeat(np.cumsum(extra) - extra, extra)
+    vertex_level = np.concatenate([level, level[sources[dummy_edge]] + 1 + dummy_step])
+
+    segment_edge = np.repeat(np.arange(len(span)), span)
+    step = np.arange(int(span.sum())) - np.repeat(np.cumsum(span) - span, span)
+    chain = first_dummy[segment_edge] + step
+    upper = np.where(step == 0, sources[segment_edge], chain - 1)
+    lower = np.where(step == span[segment_edge] - 1, targets[segment_edge], chain)
+    return nodes, vertex_level, upper, lower
+
+
+def compute_layered_layout(G: nx.DiGraph, levels: dict, sweeps: int = TREE_SWEEPS) -> dict:
+    """Layered (Sugiyama-style) node positions for the tree view, in pixels.
+
+    Nodes sit in one row per level from ``calculate_hierarchical_levels``,
+    with edges of up to ``TREE_MAX_SPAN`` levels routed through dummy
+    vertices (``layer_segments``).
+    Crossings are reduced by alternating downward and upward barycenter
+    sweeps over the rows; then each vertex is moved towards the mean x of
+    its neighbours, keeping the row order and minimum spacing. Returns
+    ``{node: (x, y)}``.
+    """
+    import numpy as np
+    if G.number_of_nodes() == 0:
+        return {}
+    nodes, vertex_level, upper, lower = layer_segments(G, levels)
+    n, count = len(nodes), len(vertex_level)
+
+    # Vertices per level, and segments ending in (into) / leaving (out_of) each level
+    by_level = np.argsort(vertex_level, kind='stable')
+    bounds = np.searchsorted(vertex_level[by_level], np.arange(int(vertex_level.max()) + 2))
+    layers = [by_level[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    segment_order = np.argsort(vertex_level[lower], kind='stable')
+    bounds = np.searchsorted(vertex_level[lower][segment_order], np.arange(len(layers) + 1))
+    into = [segment_order[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    out_of = into[1:] + [into[0][:0]]
+    rank = np.empty(count, dtype=np.int64)
+    for layer in layers:
+        rank[layer] = np.arange(len(layer))
+
+    def neighbour_mean(i: int, values, above: bool, below: bool):
+        """Mean of ``values`` over each vertex's neighbours, by rank in level ``i`` (NaN if none)."""
+        size = len(layers[i])
+        sums, degree = np.zeros(size), np.zeros(size)
+        if above:
+            local = rank[lower[into[i]]]
+            sums += np.bincount(local, weights=values[upper[into[i]]], minlength=size)
+            degree += np.bincount(local, minlength=size)
+        if below:
+            local = rank[upper[out_of[i]]]
+            sums += np.bincount(local, weights=values[lower[out_of[i]]], minlength=size)
+            degree += np.bincount(local, minlength=size)
+        with np.errstate(invalid='ignore'):
+            return sums / degree
+
+    for sweep in range(sweeps):
+        downward = sweep % 2 == 0
+        for i in range(1, len(layers)) if downward else range(len(layers) - 2, -1, -1):
+            current = np.arange(len(layers[i]))
+            barycenter = neighbour_mean(i, rank, downward, not downward)
+            barycenter = np.where(np.isnan(barycenter), current, barycenter)
+            layers[i] = layers[i][np.lexsort((current, barycenter))]
+            rank[layers[i]] = current
+
+    # Rows start packed and centred, with room for real nodes and edge crossings
+    width = np.full(count, float(TREE_DUMMY_SPACING))
+    width[:n] = TREE_NODE_SPACING
+    x = np.empty(count)
+    offsets = []
+    for layer in layers:
+        gaps = (width[layer][1:] + width[layer][:-1]) / 2
+        offsets.append(np.concatenate(([0.0], np.cumsum(gaps))))
+        x[layer] = offsets[-1] - offsets[-1][-1] / 2
+
+    for sweep in range(sweeps):
+        for i in range(len(layers)) if sweep % 2 == 0 else range(len(layers) - 1, -1, -1):
+            layer = layers[i]
+            target = neighbour_mean(i, x, True, True)
+            target = np.where(np.isnan(target), x[layer], target) - offsets[i]
+            # Without the offsets the row must be non-decreasing: average the
+            # placements that resolve conflicts by pushing right and left
+            pushed_right = np.maximum.accumulate(target)
+            pushed_left = np.minimum.accumulate(target[::-1])[::-1]
+            x[layer] = (pushed_right + pushed_left) / 2 + offsets[i]
+
+    xs = np.rint(x[:n]).astype(np.int64).tolist()
+    ys = (vertex_level[:n] * TREE_LEVEL_SEPARATION).tolist()
+    return dict(zip(nodes, zip(xs, ys)))
+
+
+def analyze_graph(
+    G: nx.DiGraph,
+    max_cycles: int = 10,
+    cycle_time_budget: float = 2.0,
+    reachability: bool = True,
+    previous: Optional[dict] = None,
+    layout_iterations: int = 0,
+) -> dict:
+    """Levels, cycles and (optionally) the reachability index of ``G``.
+
+    The tree view's positions (``compute_layered_layout``) are always
+    included under ``tree_layout``; with ``layout_iterations`` the result
+    also holds force-directed positions (``compute_force_layout``) under
+    ``layout``.
+
+    ``previous`` is the analysis saved by an earlier run (see
+    ``BuildCache.load_analysis``). If the node list is unchanged, an unchanged
+    edge set reuses every result, and edited edges recompute levels and
+    cycles but only the part of the closure they can affect. ``stale`` holds
+    the nodes whose closure may differ from ``previous`` (``None`` when there
+    was nothing to compare against), and encoded page entries recorded under
+    ``fragments`` are reused for nodes that did not change.
+    """
+    import networkx as nx
+    nodes = list(G.nodes())
+    edges = frozenset(G.edges())
+    options = (max_cycles, cycle_time_budget)
+    same_nodes = previous is not None and previous['nodes'] == nodes
+    same_edges = same_nodes and previous['edges'] == edges
+
+    if same_edges:
+        condensation = None
+        levels = previous['levels']
+        tree_layout = previous['tree_layout']
+    else:
+        with profile_stage('levels'):
+            condensation = nx.condensation(G)
+            levels = calculate_hierarchical_levels(G, condensation)
+        with profile_stage('tree_layout'):
+            tree_layout = compute_layered_layout(G, levels)
+
+    if same_edges and previous['options'] == options:
+        cycle_info = previous['cycle_info']
+    else:
+        with profile_stage('cycles'):
+            cycle_info = detect_cycles(G, max_cycles=max_cycles, time_budget=cycle_time_budget,
+                                       condensation=condensation)
+
+    layout = None
+    if layout_iterations:
+        if same_edges and previous['layout_iterations'] == layout_iterations:
+            layout = previous['layout']
+        else:
+            with profile_stage('layout'):
+                layout = compute_force_layout(G, layout_iterations)
+
+    index = None
+    stale = None
+    if reachability:
+        previous_index = previous['reachability'] if same_nodes else None
+        if previous_index is None:
+            with profile_stage('closure'):
+                index = ReachabilityIndex(G, condensation)
+        elif same_edges:
+            index, stale = previous_index, set()
+        else:
+            with profile_stage('closure'):
+                index, stale = previous_index.updated(G, edges ^ previous['edges'], condensation)
+
+    return {
+        'nodes': nodes,
+        'edges': edges,
+        'options': options,
+        'levels': levels,
+        'cycle_info': cycle_info,
+        'reachability': index,
+        'stale': stale,
+        'tree_layout': tree_layout,
+        'layout_iterations': layout_iterations,
+        'layout': layout,
+        'fragments': {'nodeData': {}, 'subgraphData': {}},
+        'previous_fragments': previous['fragments'] if same_nodes else {},
+    }
 
 
 def create_interactive_graph(
@@ -206,8 +1077,113 @@ def create_interactive_graph(
     highlight_node: Optional[str] = None,
     gantt_data: dict = None,
     gantt_versions: list = None,
+    max_cycles: int = 10,
+    cycle_time_budget: float = 2.0,
+    subgraph_mode: str = 'auto',
+    analysis: Optional[dict] = None,
+    live_reload_url: Optional[str] = None,
+    layout_iterations: int = 0,
 ):
     """Create interactive Pyvis network visualization."""
+    chunks = iter_page(
+        G,
+        title=title,
+        height=height,
+        width=width,
+        highlight_node=highlight_node,
+        gantt_data=gantt_data,
+        gantt_versions=gantt_versions,
+        max_cycles=max_cycles,
+        cycle_time_budget=cycle_time_budget,
+        subgraph_mode=subgraph_mode,
+        analysis=analysis,
+        live_reload_url=live_reload_url,
+        layout_iterations=layout_iterations,
+    )
+
+    if StageProfiler.active is not None:
+        # Assemble the page before writing it so the two stages are timed apart
+        with profile_stage('html_assembly'):
+            chunks = list(chunks)
+
+    with profile_stage('write'):
+        copy_local_assets(Path(output_path).resolve().parent)
+        # Stream into a partial file next to the page and swap it in at the
+        # end, so a failed build or an open browser never sees half a page
+        partial = Path(output_path).with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(partial, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                write_chunks(f, chunks)
+            os.replace(partial, output_path)
+        finally:
+            partial.unlink(missing_ok=True)
+
+    print(f"Interactive graph saved to: {output_path}")
+    return output_path
+
+
+def copy_local_assets(target_dir: Path):
+    """Copy pyvis' JS/CSS bundle into ``target_dir/lib`` if it is missing.
+
+    Pages rendered with ``cdn_resources='local'`` reference these files
+    relative to the HTML file. Another process may be copying the same
+    bundle at the same time, so existing files are overwritten, not an error.
+    pyvis is located without importing it, so build-cache hits stay cheap.
+    """
+    missing = [bundle for bundle in PYVIS_BUNDLES if not (target_dir / 'lib' / bundle).exists()]
+    if not missing:
+        return
+    import importlib.util
+    source = Path(importlib.util.find_spec('pyvis').origin).parent / 'templates' / 'lib'
+    for bundle in missing:
+        shutil.copytree(source / bundle, target_dir / 'lib' / bundle, dirs_exist_ok=True)
+
+
+def write_chunks(fp: TextIO, chunks: Iterable[str]):
+    """Stream page chunks to an open file handle."""
+    write = fp.write
+    for chunk in chunks:
+        write(chunk)
+
+
+def render_to_string(G: nx.DiGraph, **options) -> str:
+    """Render the complete interactive page in memory, without touching disk.
+
+    Accepts the same keyword options as ``iter_page``.
+    """
+    return ''.join(iter_page(G, **options))
+
+
+def iter_page(
+    G: nx.DiGraph,
+    title: str = "Requirements Dependency Graph",
+    height: str = "900px",
+    width: str = "100%",
+    highlight_node: Optional[str] = None,
+    gantt_data: dict = None,
+    gantt_versions: list = None,
+    max_cycles: int = 10,
+    cycle_time_budget: float = 2.0,
+    subgraph_mode: str = 'auto',
+    cdn_resources: str = 'local',
+    analysis: Optional[dict] = None,
+    live_reload_url: Optional[str] = None,
+    layout_iterations: int = 0,
+) -> Iterator[str]:
+    """Generate the interactive page as a sequence of string chunks.
+
+    Large data payloads are encoded entry by entry while the chunks are
+    consumed, so the full HTML never needs to exist in memory at once.
+
+    With ``cdn_resources='local'`` the page expects pyvis' ``lib/`` folder
+    next to it (see ``copy_local_assets``); ``'remote'`` loads it from a CDN.
+    ``analysis`` comes from ``analyze_graph`` and is computed here if omitted.
+    With ``live_reload_url`` the page reloads itself whenever that Server-Sent
+    Events endpoint sends a ``reload`` event (see ``ReloadServer``). If the
+    analysis holds a precomputed layout, nodes are placed at those positions
+    and physics starts disabled.
+    """
+    from pyvis.network import Network
 
     # Create Pyvis network
     net = Network(
@@ -219,7 +1195,12 @@ def create_interactive_graph(
         font_color="#ffffff",
         select_menu=False,
         filter_menu=False,
+        cdn_resources=cdn_resources,
     )
+    # Every Network creates its own Jinja environment and recompiles the page
+    # template; share one per process so repeated builds (watch mode, the
+    # render daemon) compile it once
+    net.templateEnv = TEMPLATE_ENVIRONMENTS.setdefault(net.template_dir, net.templateEnv)
 
     # Configure physics
     net.set_options("""
@@ -299,8 +1280,14 @@ def create_interactive_graph(
     }
     """)
 
-    # Calculate proper hierarchical levels for tree layout
-    node_levels = calculate_hierarchical_levels(G)
+    # Hierarchical levels, cycles and reachability
+    if analysis is None:
+        analysis = analyze_graph(G, max_cycles=max_cycles, cycle_time_budget=cycle_time_budget,
+                                 reachability=subgraph_mode != 'adjacency', layout_iterations=layout_iterations)
+    positions = analysis['layout']
+    if positions is not None:
+        # Nodes start where the build placed them; no stabilization on load
+        net.options['physics']['enabled'] = False
 
     # Add nodes
     for node_id in G.nodes():
@@ -335,7 +1322,7 @@ def create_interactive_graph(
             size=size,
             borderWidth=border_width,
             group=area,
-            level=node_levels.get(node_id, 0),
+            **({'x': positions[node_id][0], 'y': positions[node_id][1]} if positions is not None else {}),
         )
 
     # Add edges
@@ -343,13 +1330,154 @@ def create_interactive_graph(
         net.add_edge(source, target)
 
     # Generate HTML
-    net.save_graph(output_path)
+    base_html = net.generate_html()
+
+    # Add custom CSS and controls
+    yield from splice_page(
+        base_html, G, title, gantt_data or {}, gantt_versions or [], analysis, subgraph_mode,
+        live_reload_url, cdn_resources,
+    )
 
-    # Inject custom CSS and controls
-    inject_custom_controls(output_path, G, title, gantt_data or {}, gantt_versions or [])
 
-    print(f"Interactive graph saved to: {output_path}")
-    return output_path
+def build_adjacency_payload(G: nx.DiGraph) -> dict:
+    """Compact forward/backward adjacency for in-browser traversal.
+
+    Nodes are referenced by their position in ``nodes`` so the payload stays
+    O(V+E) regardless of how deep the dependency chains are.
+    """
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    return {
+        'nodes': nodes,
+        'out': [[index[s] for s in G.successors(n)] for n in nodes],
+        'in': [[index[p] for p in G.predecessors(n)] for n in nodes],
+    }
+
+
+def fold_text(text: str) -> str:
+    """``text`` without accents and lower-cased, for search."""
+    return SEARCH_ACCENTS.sub('', unicodedata.normalize('NFD', text)).lower()
+
+
+def build_search_index(G: nx.DiGraph) -> dict:
+    """Inverted index over node IDs, funcionalidad and requisito for the page's search.
+
+    ``terms`` holds every folded token (``fold_text``), sorted in JavaScript
+    string order so the page can find all terms with a given prefix by
+    binary search. ``postings[t]`` lists the nodes containing ``terms[t]``
+    as ``index * SEARCH_FIELD_BITS + fields`` (``index`` in ``G.nodes()``
+    order, the page's ``nodeIds``), ascending and delta-encoded.
+    """
+    term_postings = {}
+    for index, (n, attrs) in enumerate(G.nodes(data=True)):
+        fields = {}
+        for bit, text in ((1, n), (2, attrs.get('funcionalidad', '')), (4, attrs.get('requisito', 'N/A'))):
+            for token in SEARCH_TOKEN.findall(fold_text(str(text))):
+                fields[token] = fields.get(token, 0) | bit
+        for token, bits in fields.items():
+            term_postings.setdefault(token, []).append(index * SEARCH_FIELD_BITS + bits)
+
+    # JavaScript compares strings by UTF-16 code units
+    terms = sorted(term_postings, key=lambda term: term.encode('utf-16-be'))
+    postings = []
+    for term in terms:
+        entries = term_postings[term]
+        postings.append(entries[:1] + [b - a for a, b in zip(entries, entries[1:])])
+    return {'terms': terms, 'postings': postings}
+
+
+def build_facet_index(G: nx.DiGraph) -> dict:
+    """Nodes holding each value of the ``FACET_FIELDS``, for the page's filters.
+
+    Returns ``{facet: {value: [index, ...]}}`` with ascending indices in
+    ``G.nodes()`` order (the page's ``nodeIds``).
+    """
+    facets = {facet: {} for facet in FACET_FIELDS}
+    for index, (_, attrs) in enumerate(G.nodes(data=True)):
+        for facet, default in FACET_FIELDS.items():
+            facets[facet].setdefault(attrs.get(facet, default), []).append(index)
+    return facets
+
+
+def iter_json_object(items: Iterable[tuple], encoder: json.JSONEncoder) -> Iterator[str]:
+    """Encode ``(key, value)`` pairs as one JSON object, an entry at a time."""
+    yield from iter_encoded_object(((key, encoder.encode(value)) for key, value in items), encoder)
+
+
+def iter_encoded_object(entries: Iterable[tuple], encoder: json.JSONEncoder) -> Iterator[str]:
+    """Like ``iter_json_object`` for values that are already JSON text."""
+    yield '{'
+    separator = ''
+    for key, text in entries:
+        yield f'{separator}{encoder.encode(str(key))}:{text}'
+        separator = ','
+    yield '}'
+
+
+def iter_json_element(element_id: str, chunks: Iterable[str]) -> Iterator[str]:
+    """Wrap streamed JSON text in a ``<script type="application/json">`` element.
+
+    ``<`` can only occur inside JSON strings, where ``\\u003c`` means the
+    same, so escaping it per chunk keeps text such as ``</script>`` from
+    closing the element early.
+    """
+    yield f'\n    <script type="application/json" id="{element_id}">'
+    for chunk in chunks:
+        yield chunk.replace('<', '\\u003c')
+    yield '</script>'
+
+
+def iter_node_payloads(G: nx.DiGraph, cycle_nodes: set) -> Iterator[tuple]:
+    """``(node_id, nodeData entry)`` pairs for the page (include all fields)."""
+    for n, attrs in G.nodes(data=True):
+        yield n, {
+            'area': attrs.get('area', 'Unknown'),
+            'prioridad': attrs.get('prioridad', 'Media (P1)'),
+            'version': attrs.get('version', 'N/A'),
+            'funcionalidad': attrs.get('funcionalidad', ''),
+            'requisito': attrs.get('requisito', 'N/A'),
+            'owner': attrs.get('owner', 'N/A'),
+            'roles': attrs.get('roles', 'N/A'),
+            'estatus': attrs.get('estatus', 'N/A'),
+            'dependencias': attrs.get('dependencias', '—'),
+            'in_degree': G.in_degree(n),
+            'out_degree': G.out_degree(n),
+            'in_cycle': n in cycle_nodes,
+        }
+
+
+def subgraph_payload(reachability: ReachabilityIndex, node) -> dict:
+    """subgraphData entry for ``node``, decoded from the closure."""
+    return {
+        'ancestors': reachability.ancestors(node),
+        'descendants': reachability.descendants(node),
+    }
+
+
+def encode_node_payloads(G: nx.DiGraph, cycle_nodes: set, encoder: json.JSONEncoder,
+                         previous: dict, fragments: dict) -> Iterator[tuple]:
+    """``(node_id, encoded nodeData entry)`` pairs, re-encoding only changed entries.
+
+    ``previous`` maps node IDs to ``(payload, text)`` from an earlier run;
+    every entry produced here is recorded the same way in ``fragments``.
+    """
+    for n, payload in iter_node_payloads(G, cycle_nodes):
+        cached = previous.get(n)
+        text = cached[1] if cached is not None and cached[0] == payload else encoder.encode(payload)
+        fragments[n] = (payload, text)
+        yield n, text
+
+
+def encode_subgraph_payloads(G: nx.DiGraph, reachability: ReachabilityIndex, encoder: json.JSONEncoder,
+                             previous: dict, fragments: dict, stale: Optional[set]) -> Iterator[tuple]:
+    """``(node_id, encoded subgraphData entry)`` pairs, reusing ``previous`` text
+    for nodes outside ``stale`` (all nodes are stale when it is ``None``)."""
+    for n in G.nodes():
+        text = previous.get(n) if stale is not None and n not in stale else None
+        if text is None:
+            text = encoder.encode(subgraph_payload(reachability, n))
+        fragments[n] = text
+        yield n, text
 
 
 def generate_legend_items(areas):
@@ -364,56 +1492,49 @@ def generate_legend_items(areas):
     return ''.join(items)
 
 
-def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data: dict, gantt_versions: list):
-    """Inject custom filtering controls and styles into the HTML."""
-
-    with open(html_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+def splice_page(
+    base_html: str,
+    G: nx.DiGraph,
+    title: str,
+    gantt_data: dict,
+    gantt_versions: list,
+    analysis: dict,
+    subgraph_mode: str = 'auto',
+    live_reload_url: Optional[str] = None,
+    cdn_resources: str = 'local',
+) -> Iterator[str]:
+    """Combine pyvis' page with custom filtering controls and styles.
+
+    The custom CSS goes before ``</head>`` and pyvis' card markup is replaced
+    by our layout while its network script is kept. Yields the page in
+    order; the nodeData, subgraphData, graphAdjacency and ganttData payloads
+    are encoded incrementally as they are consumed, and the encoded entries
+    are recorded in ``analysis['fragments']`` for the next run.
+    """
 
     # Get unique values for filters
-    areas = sorted(set(G.nodes[n].get('area', 'Unknown') for n in G.nodes()))
+    facet_index = build_facet_index(G)
+    areas = sorted(facet_index['area'])
     priorities = ['Alta (P0)', 'Media (P1)', 'Baja (P2)']
-    versions = sorted(set(G.nodes[n].get('version', 'N/A') for n in G.nodes()))
-
-    # Detect cycles
-    try:
-        cycles = list(nx.simple_cycles(G))
-        has_cycles = len(cycles) > 0
-        cycle_nodes = set()
-        for cycle in cycles:
-            cycle_nodes.update(cycle)
-    except:
-        has_cycles = False
-        cycles = []
-        cycle_nodes = set()
-
-    # Build node data for JavaScript (include all fields)
-    node_data_js = {}
-    for n in G.nodes():
-        node_data_js[n] = {
-            'area': G.nodes[n].get('area', 'Unknown'),
-            'prioridad': G.nodes[n].get('prioridad', 'Media (P1)'),
-            'version': G.nodes[n].get('version', 'N/A'),
-            'funcionalidad': G.nodes[n].get('funcionalidad', ''),
-            'requisito': G.nodes[n].get('requisito', 'N/A'),
-            'owner': G.nodes[n].get('owner', 'N/A'),
-            'roles': G.nodes[n].get('roles', 'N/A'),
-            'estatus': G.nodes[n].get('estatus', 'N/A'),
-            'dependencias': G.nodes[n].get('dependencias', '—'),
-            'in_degree': G.in_degree(n),
-            'out_degree': G.out_degree(n),
-            'in_cycle': n in cycle_nodes,
-        }
+    versions = sorted(facet_index['version'])
+    statuses = sorted(facet_index['estatus'])
+    owners = sorted(facet_index['owner'])
+
+    cycle_info = analysis['cycle_info']
+    reachability = analysis['reachability']
+    fragments = analysis['fragments']
+    previous_fragments = analysis['previous_fragments']
+    cycle_nodes = cycle_info['in_cycle']
+    has_cycles = len(cycle_nodes) > 0
+
+    if subgraph_mode == 'auto':
+        closure_size = sum(
+            reachability.ancestor_count(n) + reachability.descendant_count(n) for n in G.nodes()
+        )
+        subgraph_mode = 'closure' if closure_size <= AUTO_CLOSURE_LIMIT else 'adjacency'
 
-    # Get ancestors and descendants for each node
-    subgraph_data = {}
-    for n in G.nodes():
-        ancestors = list(nx.ancestors(G, n))
-        descendants = list(nx.descendants(G, n))
-        subgraph_data[n] = {
-            'ancestors': ancestors,
-            'descendants': descendants,
-        }
+    # Either ancestors/descendants for each node, or adjacency for in-browser traversal
+    graph_adjacency = build_adjacency_payload(G) if subgraph_mode == 'adjacency' else None
 
     custom_css = """
     <style>
@@ -552,6 +1673,55 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             color: #cccccc;
         }
 
+        /* Performance debug panel */
+        .perf-panel {
+            position: fixed;
+            left: 15px;
+            bottom: 15px;
+            z-index: 7000;
+            display: none;
+            min-width: 280px;
+            background: rgba(15,15,35,0.95);
+            border: 1px solid #4a4a6a;
+            border-radius: 8px;
+            padding: 10px 12px;
+            font-family: monospace;
+            font-size: 12px;
+            color: #cccccc;
+            box-shadow: 0 4px 20px rgba(0,0,0,0.5);
+        }
+
+        .perf-panel.visible {
+            display: block;
+        }
+
+        .perf-panel h4 {
+            margin: 0 0 6px 0;
+            color: #00ff88;
+            font-size: 12px;
+        }
+
+        .perf-panel table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+
+        .perf-panel th,
+        .perf-panel td {
+            padding: 2px 4px;
+            text-align: right;
+        }
+
+        .perf-panel th:first-child,
+        .perf-panel td:first-child {
+            text-align: left;
+        }
+
+        .perf-panel th {
+            color: #8888aa;
+            font-weight: normal;
+        }
+
         /* Filter chips */
         .filter-chips-container {
             display: flex;
@@ -800,6 +1970,30 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             box-shadow: 0 0 10px rgba(0,255,136,0.3);
         }
 
+        /* Multi-select filters (tom-select) */
+        .control-row .ts-control,
+        .control-row .ts-dropdown {
+            background: #0f0f23;
+            border-color: #4a4a6a;
+            color: #ffffff;
+            font-size: 0.9em;
+        }
+
+        .control-row .ts-control input {
+            color: #ffffff;
+        }
+
+        .control-row .ts-wrapper.multi .ts-control > .item {
+            background: rgba(0,255,136,0.15);
+            color: #00ff88;
+            border-radius: 4px;
+        }
+
+        .control-row .ts-dropdown .active {
+            background: rgba(0,255,136,0.1);
+            color: #ffffff;
+        }
+
         /* Buttons */
         .btn {
             background: linear-gradient(135deg, #00ff88 0%, #00cc6a 100%);
@@ -1038,8 +2232,15 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             width: 100%;
             border-collapse: collapse;
             font-size: 0.8em;
+            table-layout: fixed;
         }
 
+        .data-table th[data-sort="id"] { width: 16%; }
+        .data-table th[data-sort="area"] { width: 18%; }
+        .data-table th[data-sort="prioridad"] { width: 18%; }
+        .data-table th[data-sort="version"] { width: 12%; }
+        .data-table th[data-sort="connections"] { width: 10%; }
+
         .data-table th {
             background: rgba(0,0,0,0.3);
             color: #8888aa;
@@ -1051,11 +2252,22 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             border-bottom: 1px solid #4a4a6a;
         }
 
+        /* Rows share one height so only the ones in view need to exist */
         .data-table td {
-            padding: 8px;
+            height: 34px;
+            box-sizing: border-box;
+            padding: 0 8px;
             border-bottom: 1px solid #2a2a4a;
             color: #cccccc;
-            vertical-align: top;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+
+        .data-table tr.table-spacer td {
+            height: 0;
+            padding: 0;
+            border: none;
         }
 
         .data-table tr:hover td {
@@ -1072,10 +2284,6 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             white-space: nowrap;
         }
 
-        .data-table .func-cell {
-            max-width: 200px;
-        }
-
         /* Sortable table headers */
         .data-table th.sortable {
             cursor: pointer;
@@ -1447,6 +2655,8 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
     area_options = ''.join(f'<option value="{a}">{a}</option>' for a in areas)
     priority_options = ''.join(f'<option value="{p}">{p}</option>' for p in priorities)
     version_options = ''.join(f'<option value="{v}">{v}</option>' for v in versions)
+    status_options = ''.join(f'<option value="{s}">{s}</option>' for s in statuses)
+    owner_options = ''.join(f'<option value="{o}">{o}</option>' for o in owners)
 
     # Generate Gantt UI elements (conditional on gantt data)
     has_gantt = len(gantt_versions) > 0
@@ -1509,9 +2719,16 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 <span class="shortcut-key">N</span>
                 <span class="shortcut-desc">Mostrar vecindario (nodo seleccionado)</span>
             </div>
+            <div class="shortcut-row">
+                <span class="shortcut-key">P</span>
+                <span class="shortcut-desc">Panel de rendimiento (tiempos y FPS)</span>
+            </div>
         </div>
     </div>
 
+    <!-- Performance debug panel (toggled with P) -->
+    <div class="perf-panel" id="perf-panel"></div>
+
     <div class="app-container">
         <!-- Left Panel: Controls -->
         <div class="left-panel">
@@ -1534,25 +2751,34 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 <h3>🎛️ Filtros</h3>
                 <div class="control-row">
                     <label>Área:</label>
-                    <select id="area-filter">
-                        <option value="">— Todas las áreas —</option>
+                    <select id="area-filter" multiple placeholder="— Todas las áreas —">
                         {area_options}
                     </select>
                 </div>
                 <div class="control-row">
                     <label>Prioridad:</label>
-                    <select id="priority-filter">
-                        <option value="">— Todas las prioridades —</option>
+                    <select id="priority-filter" multiple placeholder="— Todas las prioridades —">
                         {priority_options}
                     </select>
                 </div>
                 <div class="control-row">
                     <label>Versión:</label>
-                    <select id="version-filter">
-                        <option value="">— Todas las versiones —</option>
+                    <select id="version-filter" multiple placeholder="— Todas las versiones —">
                         {version_options}
                     </select>
                 </div>
+                <div class="control-row">
+                    <label>Estatus:</label>
+                    <select id="status-filter" multiple placeholder="— Todos los estatus —">
+                        {status_options}
+                    </select>
+                </div>
+                <div class="control-row">
+                    <label>Owner:</label>
+                    <select id="owner-filter" multiple placeholder="— Todos los owners —">
+                        {owner_options}
+                    </select>
+                </div>
             </div>
             <div class="filter-chips-container" id="filter-chips"></div>
 
@@ -1666,6 +2892,8 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                         </tr>
                     </thead>
                     <tbody id="table-body">
+                        <tr class="table-spacer" id="table-spacer-top"><td colspan="6"></td></tr>
+                        <tr class="table-spacer" id="table-spacer-bottom"><td colspan="6"></td></tr>
                     </tbody>
                 </table>
             </div>
@@ -1675,24 +2903,64 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
     <div id="hover-tooltip"></div>
     """
 
-    # Prepare cycle data for JS
-    cycles_js = [list(c) for c in cycles[:10]]  # Limit to first 10 cycles
-
-    custom_js = f"""
+    def iter_data_script():
+        encoder = json.JSONEncoder(ensure_ascii=False)
+        compact = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        with profile_stage('node_payload'):
+            yield from iter_json_element('node-data', iter_encoded_object(encode_node_payloads(
+                G, cycle_nodes, encoder, previous_fragments.get('nodeData', {}), fragments['nodeData'],
+            ), encoder))
+        if subgraph_mode == 'closure':
+            with profile_stage('subgraph_payload'):
+                yield from iter_json_element('subgraph-data', iter_encoded_object(encode_subgraph_payloads(
+                    G, reachability, encoder, previous_fragments.get('subgraphData', {}),
+                    fragments['subgraphData'], analysis['stale'],
+                ), encoder))
+        else:
+            yield from iter_json_element('subgraph-data', ['null'])
+        yield f"""
     <script>
     (function() {{
-        // Data
-        const nodeData = {json.dumps(node_data_js, ensure_ascii=False)};
-        const subgraphData = {json.dumps(subgraph_data)};
+        // Data. The two largest payloads are JSON elements decoded here, so
+        // the nodeData and subgraphData measures time the actual parse
+        performance.mark('nodeData:start');
+        const nodeData = JSON.parse(document.getElementById('node-data').textContent);
+        performance.mark('nodeData:end');
+        performance.mark('subgraphData:start');
+        const subgraphData = JSON.parse(document.getElementById('subgraph-data').textContent);
+        performance.mark('subgraphData:end');
+        const graphAdjacency = {compact.encode(graph_adjacency)};
+        const ganttData = """
+        yield from iter_json_object(
+            ((version, tasks) for version, tasks in gantt_data.items()), encoder,
+        )
+        yield """;
+        const treePositions = """
+        yield from iter_json_object(analysis['tree_layout'].items(), compact)
+        yield f""";
+        const nodeIds = {compact.encode(list(G.nodes()))};
+        const facetIndex = """
+        yield from iter_json_object(facet_index.items(), compact)
+        yield """;
+        const searchIndex = """
+        with profile_stage('search_index'):
+            yield from iter_json_object(build_search_index(G).items(), compact)
+        yield ';'
+
+    custom_js = f"""
         const areaColors = {json.dumps(AREA_COLORS)};
         const totalNodes = {len(G.nodes())};
         const totalEdges = {len(G.edges())};
         const hasCycles = {str(has_cycles).lower()};
-        const cycles = {json.dumps(cycles_js)};
+        const cycles = {json.dumps(cycle_info['cycles'], ensure_ascii=False)};
         const cycleNodeCount = {len(cycle_nodes)};
-        const ganttData = {json.dumps(gantt_data, ensure_ascii=False)};
+        const cycleCount = {cycle_info['cycle_count']};
+        const cyclesTruncated = {str(cycle_info['truncated']).lower()};
+        const cycleCountLabel = cyclesTruncated ? `${{cycleCount}}+` : `${{cycleCount}}`;
         const ganttVersions = {json.dumps(gantt_versions)};
         const hasGanttData = ganttVersions.length > 0;
+        const precomputedLayout = {str(analysis['layout'] is not None).lower()};
+        const forcePositions = precomputedLayout ? nodes.get({{ fields: ['id', 'x', 'y'] }}) : null;
 
         // State
         let selectedNodeId = null;
@@ -1700,9 +2968,56 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
         let currentGanttVersion = ganttVersions[0] || 'Default';
         let ganttChart = null;
         let visibleNodeIds = new Set(Object.keys(nodeData));
+        // Nodes currently shown in the network, as last applied by updateVisibility
+        let shownNodeIds = new Set(visibleNodeIds);
+        let fitTimer = null;
         let currentViewContext = {{ type: 'all', node: null }};
         let sortState = {{ column: 'id', direction: 'asc' }};
+        // Table rows in display order; only those in view (plus a margin)
+        // are in the DOM, drawn into a pool of recycled <tr> elements
+        const tableRowHeight = 34;
+        const tableOverscan = 8;
+        let tableRows = [];
+        let tableRowsVersion = 0;
+        const tableRowPool = [];
+        let tableWindowFrame = null;
         let autocompleteIndex = -1;
+        const adjacencyIndex = graphAdjacency ?
+            Object.fromEntries(graphAdjacency.nodes.map((id, i) => [id, i])) : null;
+        const reachableCache = {{ ancestors: new Map(), descendants: new Map() }};
+        // Filters: the nodes holding each facet value, as a bitmap over
+        // nodeIds built on first use from facetIndex. Values of one facet
+        // are alternatives; facets combine, word by word
+        const facetFilters = [
+            {{ facet: 'area', element: 'area-filter', label: 'Área' }},
+            {{ facet: 'prioridad', element: 'priority-filter', label: 'Prioridad' }},
+            {{ facet: 'version', element: 'version-filter', label: 'Versión' }},
+            {{ facet: 'estatus', element: 'status-filter', label: 'Estatus' }},
+            {{ facet: 'owner', element: 'owner-filter', label: 'Owner' }}
+        ];
+        const bitmapWords = Math.ceil(nodeIds.length / 32);
+        const facetBitmaps = new Map(facetFilters.map(filter => [filter.facet, new Map()]));
+
+        // Edges touching each node, so visibility changes only revisit those
+        const incidentEdges = new Map();
+        edges.get({{ fields: ['id', 'from', 'to'] }}).forEach(edge => {{
+            for (const id of [edge.from, edge.to]) {{
+                if (!incidentEdges.has(id)) incidentEdges.set(id, []);
+                incidentEdges.get(id).push(edge);
+            }}
+        }});
+
+        // Counts over the visible nodes, kept up to date by updateVisibility
+        // from the nodes and edges whose visibility changed
+        const visibleStats = {{
+            edges: totalEdges,
+            priority: new Map([['Alta (P0)', 0], ['Media (P1)', 0], ['Baja (P2)', 0]]),
+            area: new Map()
+        }};
+        nodeIds.forEach(id => countVisibleNode(id, 1));
+        // Nodes by connections, most first (ties in node order)
+        const degreeOrder = nodeIds.slice().sort((a, b) => connectionCount(b) - connectionCount(a));
+        const degreeRank = new Map(degreeOrder.map((id, rank) => [id, rank]));
 
         // Toast notification system
         function showToast(message, type = 'info', duration = 3000) {{
@@ -1718,6 +3033,93 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             }}, duration);
         }}
 
+        // Performance instrumentation: main steps are recorded with
+        // performance.measure() (visible in the browser's performance
+        // timeline) and summarised in a debug panel toggled with P
+        const perfTimings = new Map();
+        let perfSequence = 0;
+        let perfPanelVisible = false;
+        let perfFrames = 0;
+        let perfFrameSince = 0;
+        let perfFps = null;
+
+        function recordMeasure(name, startMark, endMark) {{
+            if (performance.getEntriesByName(startMark, 'mark').length === 0) return;
+            performance.measure(name, startMark, endMark);
+            const entries = performance.getEntriesByName(name, 'measure');
+            const duration = entries[entries.length - 1].duration;
+            // Keep the timeline buffer bounded on long sessions
+            performance.clearMarks(startMark);
+            if (endMark) performance.clearMarks(endMark);
+            performance.clearMeasures(name);
+
+            const timing = perfTimings.get(name) || {{ last: 0, total: 0, count: 0 }};
+            timing.last = duration;
+            timing.total += duration;
+            timing.count++;
+            perfTimings.set(name, timing);
+            if (perfPanelVisible) renderPerfPanel();
+        }}
+
+        function instrument(name, fn) {{
+            return function(...args) {{
+                const startMark = `${{name}}:start:${{++perfSequence}}`;
+                performance.mark(startMark);
+                try {{
+                    return fn.apply(this, args);
+                }} finally {{
+                    recordMeasure(name, startMark);
+                }}
+            }};
+        }}
+
+        function renderPerfPanel() {{
+            const rows = Array.from(perfTimings, ([name, t]) => `
+                <tr><td>${{name}}</td><td>${{t.last.toFixed(1)}}</td>
+                <td>${{(t.total / t.count).toFixed(1)}}</td><td>${{t.count}}</td></tr>`).join('');
+            document.getElementById('perf-panel').innerHTML = `
+                <h4>Rendimiento</h4>
+                <div>FPS: ${{perfFps === null ? '…' : perfFps.toFixed(0)}} ·
+                    Nodos visibles: ${{visibleNodeIds.size}}/${{totalNodes}}</div>
+                <table>
+                    <tr><th>Paso</th><th>Último (ms)</th><th>Media (ms)</th><th>N</th></tr>
+                    ${{rows}}
+                </table>`;
+        }}
+
+        function countPerfFrame(now) {{
+            if (!perfPanelVisible) return;
+            perfFrames++;
+            if (now - perfFrameSince >= 1000) {{
+                perfFps = perfFrames * 1000 / (now - perfFrameSince);
+                perfFrames = 0;
+                perfFrameSince = now;
+                renderPerfPanel();
+            }}
+            requestAnimationFrame(countPerfFrame);
+        }}
+
+        function togglePerfPanel() {{
+            perfPanelVisible = !perfPanelVisible;
+            document.getElementById('perf-panel').classList.toggle('visible', perfPanelVisible);
+            if (!perfPanelVisible) return;
+            // Frames are only counted while the panel is open
+            perfFps = null;
+            perfFrames = 0;
+            perfFrameSince = performance.now();
+            renderPerfPanel();
+            requestAnimationFrame(countPerfFrame);
+        }}
+
+        recordMeasure('nodeData', 'nodeData:start', 'nodeData:end');
+        recordMeasure('subgraphData', 'subgraphData:start', 'subgraphData:end');
+        initializeApp = instrument('initializeApp', initializeApp);
+        applyFilters = instrument('applyFilters', applyFilters);
+        updateVisibility = instrument('updateVisibility', updateVisibility);
+        updateTable = instrument('updateTable', updateTable);
+        updateStatsPanel = instrument('updateStatsPanel', updateStatsPanel);
+        initGantt = instrument('initGantt', initGantt);
+
         // Wait for network to be ready
         function waitForNetwork(callback) {{
             if (typeof network !== 'undefined' && network) {{
@@ -1728,7 +3130,13 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
         }}
 
         // Initialize when ready
+        performance.mark('waitForNetwork:start');
         waitForNetwork(function() {{
+            recordMeasure('waitForNetwork', 'waitForNetwork:start');
+            // The first stabilization has already started inside the network
+            performance.mark('stabilization:start');
+            network.on('startStabilizing', () => performance.mark('stabilization:start'));
+            network.on('stabilizationIterationsDone', () => recordMeasure('stabilization', 'stabilization:start'));
             console.log('Network ready, initializing custom controls...');
             initializeApp();
         }});
@@ -1753,7 +3161,7 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             // Show cycle warning if cycles detected
             if (hasCycles) {{
                 document.getElementById('cycle-warning').classList.add('visible');
-                showToast(`⚠️ Se detectaron ${{cycles.length}} ciclos de dependencias`, 'warning', 5000);
+                showToast(`⚠️ Se detectaron ${{cycleCountLabel}} ciclos de dependencias`, 'warning', 5000);
             }}
 
             showToast('Visualización cargada correctamente', 'success');
@@ -1779,9 +3187,12 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             }});
 
             // Filter dropdowns
-            document.getElementById('area-filter').addEventListener('change', applyFilters);
-            document.getElementById('priority-filter').addEventListener('change', applyFilters);
-            document.getElementById('version-filter').addEventListener('change', applyFilters);
+            facetFilters.forEach(filter => {{
+                if (window.TomSelect) {{
+                    new TomSelect(`#${{filter.element}}`, {{ plugins: ['remove_button'], hidePlaceholder: true }});
+                }}
+                document.getElementById(filter.element).addEventListener('change', applyFilters);
+            }});
 
             // Exploration buttons
             document.getElementById('btn-ancestors').addEventListener('click', showAncestors);
@@ -1808,7 +3219,7 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             document.querySelectorAll('.legend-item').forEach(item => {{
                 item.addEventListener('click', function() {{
                     const area = this.getAttribute('data-area');
-                    document.getElementById('area-filter').value = area;
+                    setFacetValues(facetFilters[0], [area]);
                     applyFilters();
                 }});
             }});
@@ -1824,6 +3235,28 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 this.textContent = isCollapsed ? '▶' : '▼';
             }});
 
+            // Table rows: one delegated click handler, redraw the window on scroll
+            document.getElementById('table-body').addEventListener('click', event => {{
+                const row = event.target.closest('tr[data-id]');
+                if (!row) return;
+                const id = row.dataset.id;
+                network.focus(id, {{
+                    scale: 1.5,
+                    animation: {{ duration: 500 }}
+                }});
+                network.selectNodes([id]);
+                selectedNodeId = id;
+                showSelectedInfo(id);
+            }});
+            document.querySelector('.table-container').addEventListener('scroll', scheduleTableWindow);
+            window.addEventListener('resize', scheduleTableWindow);
+
+            // Top connected list
+            document.getElementById('top-connected').addEventListener('click', event => {{
+                const item = event.target.closest('.top-connected-item');
+                if (item) focusOnNode(item.dataset.id);
+            }});
+
             // Sortable table headers
             document.querySelectorAll('.data-table th.sortable').forEach(th => {{
                 th.addEventListener('click', function() {{
@@ -1855,17 +3288,16 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
         }}
 
         function showCycleNodes() {{
-            if (!hasCycles || cycles.length === 0) {{
+            if (!hasCycles) {{
                 showToast('No se encontraron ciclos de dependencias', 'info');
                 return;
             }}
 
-            // Get all nodes involved in cycles
-            const cycleNodeIds = new Set();
-            cycles.forEach(cycle => cycle.forEach(nodeId => cycleNodeIds.add(nodeId)));
+            // Get all nodes involved in cycles (exact, even if enumeration was truncated)
+            const cycleNodeIds = new Set(Object.keys(nodeData).filter(id => nodeData[id].in_cycle));
 
             visibleNodeIds = cycleNodeIds;
-            currentViewContext = {{ type: 'cycles', count: cycles.length }};
+            currentViewContext = {{ type: 'cycles', count: cycleCount }};
             updateVisibility();
             updateTable();
             updateStats();
@@ -1873,10 +3305,10 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             updateStatsPanel();
 
             // Update breadcrumb manually for cycles
-            document.getElementById('breadcrumb-text').innerHTML = `Nodos en ciclos (<strong>${{cycleNodeIds.size}}</strong> nodos, ${{cycles.length}} ciclos)`;
+            document.getElementById('breadcrumb-text').innerHTML = `Nodos en ciclos (<strong>${{cycleNodeIds.size}}</strong> nodos, ${{cycleCountLabel}} ciclos)`;
             document.getElementById('breadcrumb-reset').style.display = 'block';
 
-            showToast(`Mostrando ${{cycleNodeIds.size}} nodos involucrados en ${{cycles.length}} ciclos`, 'warning');
+            showToast(`Mostrando ${{cycleNodeIds.size}} nodos involucrados en ${{cycleCountLabel}} ciclos`, 'warning');
         }}
 
         function setupNetworkHandlers() {{
@@ -2042,31 +3474,75 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                     case 'N':
                         if (selectedNodeId) showNeighborhood();
                         break;
+                    case 'p':
+                    case 'P':
+                        togglePerfPanel();
+                        break;
                 }}
             }});
         }}
 
         // Autocomplete
+        // Search over the index built by the generator: every word of the
+        // query must start a word of the node's ID, funcionalidad or requisito
+        const searchFieldBits = {SEARCH_FIELD_BITS};
+        let searchTimer = null;
+
+        function foldText(text) {{
+            return text.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+        }}
+
+        function searchRequirements(query) {{
+            // Map of node ID -> bits of the fields every word matched in (may be 0)
+            const tokens = foldText(query).match(/[\\p{{L}}\\p{{N}}]+/gu) || [];
+            const {{ terms, postings }} = searchIndex;
+            let found = null;
+            for (const token of tokens) {{
+                const hits = new Map();
+                // Terms starting with the token are contiguous in the sorted vocabulary
+                let lo = 0, hi = terms.length;
+                while (lo < hi) {{
+                    const mid = (lo + hi) >> 1;
+                    if (terms[mid] < token) lo = mid + 1;
+                    else hi = mid;
+                }}
+                for (let t = lo; t < terms.length && terms[t].startsWith(token); t++) {{
+                    let entry = 0;
+                    for (const delta of postings[t]) {{
+                        entry += delta;
+                        const index = Math.floor(entry / searchFieldBits);
+                        if (found !== null && !found.has(index)) continue;
+                        hits.set(index, (hits.get(index) || 0) | entry % searchFieldBits);
+                    }}
+                }}
+                if (found !== null) hits.forEach((fields, index) => hits.set(index, fields & found.get(index)));
+                found = hits;
+                if (found.size === 0) break;
+            }}
+            const matches = new Map();
+            if (found !== null) found.forEach((fields, index) => matches.set(nodeIds[index], fields));
+            return matches;
+        }}
+
         function setupAutocomplete() {{
             const input = document.getElementById('node-search');
             const dropdown = document.getElementById('autocomplete-dropdown');
 
             input.addEventListener('input', function() {{
-                const query = this.value.trim().toLowerCase();
+                const query = this.value.trim();
+                clearTimeout(searchTimer);
                 if (query.length < 2) {{
                     dropdown.classList.remove('visible');
                     return;
                 }}
+                // Look up once typing pauses
+                searchTimer = setTimeout(() => showAutocomplete(query), 120);
+            }});
 
+            function showAutocomplete(query) {{
                 const matches = [];
-                Object.keys(nodeData).forEach(id => {{
-                    const data = nodeData[id];
-                    const idMatch = id.toLowerCase().includes(query);
-                    const funcMatch = data.funcionalidad.toLowerCase().includes(query);
-                    const reqMatch = data.requisito.toLowerCase().includes(query);
-                    if (idMatch || funcMatch || reqMatch) {{
-                        matches.push({{ id, data, idMatch, funcMatch, reqMatch }});
-                    }}
+                searchRequirements(query).forEach((fields, id) => {{
+                    matches.push({{ id, data: nodeData[id], idMatch: fields & 1, funcMatch: fields & 2, reqMatch: fields & 4 }});
                 }});
 
                 if (matches.length === 0) {{
@@ -2101,7 +3577,7 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                         focusOnNode(id);
                     }});
                 }});
-            }});
+            }}
 
             input.addEventListener('keydown', function(e) {{
                 const items = dropdown.querySelectorAll('.autocomplete-item');
@@ -2161,16 +3637,8 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             }}
 
             // Try full-text search
-            const query = input.toLowerCase();
-            const matches = [];
-            Object.keys(nodeData).forEach(id => {{
-                const data = nodeData[id];
-                if (id.toLowerCase().includes(query) ||
-                    data.funcionalidad.toLowerCase().includes(query) ||
-                    data.requisito.toLowerCase().includes(query)) {{
-                    matches.push(id);
-                }}
-            }});
+            clearTimeout(searchTimer);
+            const matches = Array.from(searchRequirements(input).keys());
 
             if (matches.length === 1) {{
                 focusOnNode(matches[0]);
@@ -2189,25 +3657,68 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             }}
         }}
 
-        function applyFilters() {{
-            const areaFilter = document.getElementById('area-filter').value;
-            const priorityFilter = document.getElementById('priority-filter').value;
-            const versionFilter = document.getElementById('version-filter').value;
+        function facetBitmap(facet, value) {{
+            const cache = facetBitmaps.get(facet);
+            let bitmap = cache.get(value);
+            if (!bitmap) {{
+                bitmap = new Uint32Array(bitmapWords);
+                for (const index of facetIndex[facet][value] || []) {{
+                    bitmap[index >>> 5] |= 1 << (index & 31);
+                }}
+                cache.set(value, bitmap);
+            }}
+            return bitmap;
+        }}
 
-            visibleNodeIds = new Set();
+        function selectedFacetValues(filter) {{
+            return Array.from(document.getElementById(filter.element).selectedOptions, option => option.value);
+        }}
 
-            Object.keys(nodeData).forEach(nodeId => {{
-                const data = nodeData[nodeId];
-                const matchArea = !areaFilter || data.area === areaFilter;
-                const matchPriority = !priorityFilter || data.prioridad === priorityFilter;
-                const matchVersion = !versionFilter || data.version === versionFilter;
+        function setFacetValues(filter, values) {{
+            const select = document.getElementById(filter.element);
+            if (select.tomselect) {{
+                select.tomselect.setValue(values, true);
+            }} else {{
+                Array.from(select.options).forEach(option => {{
+                    option.selected = values.includes(option.value);
+                }});
+            }}
+        }}
 
-                if (matchArea && matchPriority && matchVersion) {{
-                    visibleNodeIds.add(nodeId);
+        function applyFilters() {{
+            const selection = facetFilters
+                .map(filter => ({{ filter, values: selectedFacetValues(filter) }}))
+                .filter(entry => entry.values.length > 0);
+
+            let matching = null;
+            selection.forEach(({{ filter, values }}) => {{
+                const any = new Uint32Array(bitmapWords);
+                values.forEach(value => {{
+                    const bitmap = facetBitmap(filter.facet, value);
+                    for (let w = 0; w < bitmapWords; w++) any[w] |= bitmap[w];
+                }});
+                if (matching === null) {{
+                    matching = any;
+                }} else {{
+                    for (let w = 0; w < bitmapWords; w++) matching[w] &= any[w];
                 }}
             }});
 
-            currentViewContext = {{ type: 'filter', area: areaFilter, priority: priorityFilter, version: versionFilter }};
+            if (matching === null) {{
+                visibleNodeIds = new Set(nodeIds);
+            }} else {{
+                visibleNodeIds = new Set();
+                for (let w = 0; w < bitmapWords; w++) {{
+                    for (let word = matching[w]; word !== 0; word &= word - 1) {{
+                        visibleNodeIds.add(nodeIds[w * 32 + 31 - Math.clz32(word & -word)]);
+                    }}
+                }}
+            }}
+
+            currentViewContext = {{
+                type: 'filter',
+                selection: selection.map(({{ filter, values }}) => ({{ label: filter.label, values }}))
+            }};
             updateVisibility();
             updateTable();
             updateStats();
@@ -2217,26 +3728,43 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
         }}
 
         function updateVisibility() {{
-            const nodeUpdates = Object.keys(nodeData).map(id => ({{
-                id: id,
-                hidden: !visibleNodeIds.has(id)
-            }}));
-            nodes.update(nodeUpdates);
+            // Only nodes whose visibility changed since the last call, and
+            // the edges touching them, are sent to the DataSets
+            const nodeUpdates = [];
+            shownNodeIds.forEach(id => {{
+                if (!visibleNodeIds.has(id)) nodeUpdates.push({{ id: id, hidden: true }});
+            }});
+            visibleNodeIds.forEach(id => {{
+                if (!shownNodeIds.has(id)) nodeUpdates.push({{ id: id, hidden: false }});
+            }});
 
-            const edgeUpdates = edges.get().map(edge => ({{
-                id: edge.id,
-                hidden: !visibleNodeIds.has(edge.from) || !visibleNodeIds.has(edge.to)
-            }}));
-            edges.update(edgeUpdates);
+            const edgeUpdates = new Map();
+            nodeUpdates.forEach(update => {{
+                (incidentEdges.get(update.id) || []).forEach(edge => {{
+                    if (edgeUpdates.has(edge.id)) return;
+                    const wasHidden = !shownNodeIds.has(edge.from) || !shownNodeIds.has(edge.to);
+                    const hidden = !visibleNodeIds.has(edge.from) || !visibleNodeIds.has(edge.to);
+                    if (hidden !== wasHidden) edgeUpdates.set(edge.id, {{ id: edge.id, hidden: hidden }});
+                }});
+            }});
 
-            setTimeout(() => {{
+            nodeUpdates.forEach(update => countVisibleNode(update.id, update.hidden ? -1 : 1));
+            edgeUpdates.forEach(update => {{
+                visibleStats.edges += update.hidden ? -1 : 1;
+            }});
+
+            shownNodeIds = new Set(visibleNodeIds);
+            if (nodeUpdates.length) nodes.update(nodeUpdates);
+            if (edgeUpdates.size) edges.update(Array.from(edgeUpdates.values()));
+
+            // Successive changes share one fit
+            clearTimeout(fitTimer);
+            fitTimer = setTimeout(() => {{
                 network.fit({{ animation: {{ duration: 300 }} }});
             }}, 100);
         }}
 
         function updateTable() {{
-            const tbody = document.getElementById('table-body');
-
             // Get sorted IDs based on sortState
             let sortedData = Array.from(visibleNodeIds).map(id => ({{
                 id,
@@ -2285,39 +3813,91 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                     String(bVal).localeCompare(String(aVal));
             }});
 
-            let html = '';
-            sortedData.forEach(item => {{
-                const priorityClass = item.prioridad.includes('P0') ? 'priority-p0' :
-                                      item.prioridad.includes('P1') ? 'priority-p1' : 'priority-p2';
-
-                html += `
-                    <tr data-id="${{item.id}}" style="cursor: pointer;">
-                        <td class="id-cell">${{item.id}}</td>
-                        <td class="area-cell">${{item.area}}</td>
-                        <td class="func-cell">${{item.funcionalidad}}</td>
-                        <td><span class="priority-badge ${{priorityClass}}">${{item.prioridad}}</span></td>
-                        <td>${{item.version}}</td>
-                        <td style="text-align:center">${{item.connections}}</td>
-                    </tr>
-                `;
+            tableRows = sortedData;
+            document.getElementById('table-count').textContent = visibleNodeIds.size + ' requisitos';
+            tableRowsVersion++;
+            renderTableWindow();
+        }}
+
+        function scheduleTableWindow() {{
+            if (tableWindowFrame !== null) return;
+            tableWindowFrame = requestAnimationFrame(() => {{
+                tableWindowFrame = null;
+                renderTableWindow();
             }});
+        }}
 
-            tbody.innerHTML = html;
-            document.getElementById('table-count').textContent = visibleNodeIds.size + ' requisitos';
+        function createTableRow() {{
+            const row = document.createElement('tr');
+            row.style.cursor = 'pointer';
+            row.innerHTML = `
+                <td class="id-cell"></td>
+                <td class="area-cell"></td>
+                <td class="func-cell"></td>
+                <td><span class="priority-badge"></span></td>
+                <td></td>
+                <td style="text-align:center"></td>`;
+            tableRowPool.push(row);
+            return row;
+        }}
 
-            // Add click handlers to table rows
-            tbody.querySelectorAll('tr').forEach(row => {{
-                row.addEventListener('click', function() {{
-                    const id = this.getAttribute('data-id');
-                    network.focus(id, {{
-                        scale: 1.5,
-                        animation: {{ duration: 500 }}
-                    }});
-                    network.selectNodes([id]);
-                    selectedNodeId = id;
-                    showSelectedInfo(id);
-                }});
+        function fillTableRow(row, item) {{
+            const cells = row.children;
+            const priorityClass = item.prioridad.includes('P0') ? 'priority-p0' :
+                                  item.prioridad.includes('P1') ? 'priority-p1' : 'priority-p2';
+            row.dataset.id = item.id;
+            cells[0].textContent = item.id;
+            cells[1].textContent = item.area;
+            cells[2].textContent = item.funcionalidad;
+            cells[2].title = item.funcionalidad;
+            cells[3].firstElementChild.className = `priority-badge ${{priorityClass}}`;
+            cells[3].firstElementChild.textContent = item.prioridad;
+            cells[4].textContent = item.version;
+            cells[5].textContent = item.connections;
+        }}
+
+        function renderTableWindow() {{
+            const container = document.querySelector('.table-container');
+            const header = document.querySelector('.data-table thead');
+            const tbody = document.getElementById('table-body');
+            const bottomSpacer = document.getElementById('table-spacer-bottom');
+
+            const scrolled = Math.max(0, container.scrollTop - (header.offsetHeight || 0));
+            const first = Math.max(0, Math.floor(scrolled / tableRowHeight) - tableOverscan);
+            const inView = Math.ceil((container.clientHeight || 0) / tableRowHeight) + 2 * tableOverscan;
+            const last = Math.min(tableRows.length, first + inView);
+
+            // Rows still in view keep their element and contents; rows that
+            // left the window are refilled with the ones that entered it
+            const drawn = new Map();
+            const free = [];
+            tableRowPool.forEach(row => {{
+                const index = Number(row.dataset.index);
+                if (index >= first && index < last) drawn.set(index, row);
+                else free.push(row);
+            }});
+            const kept = new Set(drawn.values());
+            let cursor = document.getElementById('table-spacer-top').nextSibling;
+            for (let index = first; index < last; index++) {{
+                while (cursor !== bottomSpacer && !kept.has(cursor)) cursor = cursor.nextSibling;
+                let row = drawn.get(index);
+                if (!row || Number(row.dataset.version) !== tableRowsVersion) {{
+                    row = row || free.pop() || createTableRow();
+                    fillTableRow(row, tableRows[index]);
+                    row.dataset.index = index;
+                    row.dataset.version = tableRowsVersion;
+                    row.style.display = '';
+                }}
+                if (row === cursor) cursor = cursor.nextSibling;
+                else tbody.insertBefore(row, cursor);
+            }}
+            free.forEach(row => {{
+                row.style.display = 'none';
+                row.dataset.index = -1;
             }});
+
+            document.getElementById('table-spacer-top').style.height = `${{first * tableRowHeight}}px`;
+            bottomSpacer.style.height = `${{(tableRows.length - last) * tableRowHeight}}px`;
         }}
 
         function updateSortIndicators() {{
@@ -2334,43 +3914,28 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
 
         function updateStats() {{
             document.getElementById('visible-nodes').textContent = visibleNodeIds.size;
-            const visibleEdgeCount = edges.get().filter(e =>
-                visibleNodeIds.has(e.from) && visibleNodeIds.has(e.to)
-            ).length;
-            document.getElementById('visible-edges').textContent = visibleEdgeCount;
+            document.getElementById('visible-edges').textContent = visibleStats.edges;
         }}
 
         function updateFilterChips() {{
             const container = document.getElementById('filter-chips');
             const chips = [];
-            const areaFilter = document.getElementById('area-filter').value;
-            const priorityFilter = document.getElementById('priority-filter').value;
-            const versionFilter = document.getElementById('version-filter').value;
-
-            if (areaFilter) {{
-                chips.push({{ type: 'area', label: 'Área', value: areaFilter }});
-            }}
-            if (priorityFilter) {{
-                chips.push({{ type: 'priority', label: 'Prioridad', value: priorityFilter }});
-            }}
-            if (versionFilter) {{
-                chips.push({{ type: 'version', label: 'Versión', value: versionFilter }});
-            }}
+            facetFilters.forEach(filter => {{
+                selectedFacetValues(filter).forEach(value => chips.push({{ filter, value }}));
+            }});
 
-            container.innerHTML = chips.map(chip => `
-                <div class="filter-chip" data-type="${{chip.type}}">
-                    <span class="filter-chip-label">${{chip.label}}:</span>
+            container.innerHTML = chips.map((chip, i) => `
+                <div class="filter-chip" data-type="${{chip.filter.facet}}">
+                    <span class="filter-chip-label">${{chip.filter.label}}:</span>
                     <span>${{chip.value}}</span>
-                    <button class="filter-chip-remove" data-type="${{chip.type}}">&times;</button>
+                    <button class="filter-chip-remove" data-chip="${{i}}">&times;</button>
                 </div>
             `).join('');
 
             container.querySelectorAll('.filter-chip-remove').forEach(btn => {{
                 btn.addEventListener('click', function() {{
-                    const type = this.dataset.type;
-                    if (type === 'area') document.getElementById('area-filter').value = '';
-                    if (type === 'priority') document.getElementById('priority-filter').value = '';
-                    if (type === 'version') document.getElementById('version-filter').value = '';
+                    const chip = chips[Number(this.dataset.chip)];
+                    setFacetValues(chip.filter, selectedFacetValues(chip.filter).filter(value => value !== chip.value));
                     applyFilters();
                 }});
             }});
@@ -2385,10 +3950,7 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 textEl.innerHTML = `Todos los requisitos (<strong>${{totalNodes}}</strong>)`;
                 resetBtn.style.display = 'none';
             }} else if (ctx.type === 'filter') {{
-                const parts = [];
-                if (ctx.area) parts.push(ctx.area);
-                if (ctx.priority) parts.push(ctx.priority);
-                if (ctx.version) parts.push(ctx.version);
+                const parts = ctx.selection.map(entry => entry.values.join(' / '));
                 textEl.innerHTML = `Filtrado: ${{parts.join(', ')}} (<strong>${{visibleNodeIds.size}}</strong>)`;
                 resetBtn.style.display = 'block';
             }} else if (ctx.type === 'ancestors') {{
@@ -2406,69 +3968,99 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             }}
         }}
 
-        function updateStatsPanel() {{
-            // Priority distribution
-            const priorityCounts = {{ 'Alta (P0)': 0, 'Media (P1)': 0, 'Baja (P2)': 0 }};
-            visibleNodeIds.forEach(id => {{
-                const p = nodeData[id].prioridad;
-                if (priorityCounts[p] !== undefined) priorityCounts[p]++;
-            }});
+        function connectionCount(id) {{
+            return nodeData[id].in_degree + nodeData[id].out_degree;
+        }}
 
-            const priorityColors = {{ 'Alta (P0)': '#ff6b6b', 'Media (P1)': '#ffd93d', 'Baja (P2)': '#4ecdc4' }};
-            const maxPriority = Math.max(...Object.values(priorityCounts), 1);
+        function countVisibleNode(id, delta) {{
+            const data = nodeData[id];
+            visibleStats.priority.set(data.prioridad, (visibleStats.priority.get(data.prioridad) || 0) + delta);
+            visibleStats.area.set(data.area, (visibleStats.area.get(data.area) || 0) + delta);
+        }}
 
-            document.getElementById('priority-stats').innerHTML = Object.entries(priorityCounts).map(([label, count]) => `
-                <div class="stats-bar-row">
-                    <span class="stats-bar-label">${{label.replace(' (P0)', '').replace(' (P1)', '').replace(' (P2)', '')}}</span>
-                    <div class="stats-bar-wrapper">
-                        <div class="stats-bar" style="width: ${{(count / maxPriority) * 100}}%; background: ${{priorityColors[label]}}"></div>
-                    </div>
-                    <span class="stats-bar-value">${{count}}</span>
-                </div>
-            `).join('');
+        function topConnected(count) {{
+            // Few visible nodes: rank them directly; otherwise the first
+            // visible ones in degreeOrder come after a few skips
+            if (visibleNodeIds.size * 8 < nodeIds.length) {{
+                return Array.from(visibleNodeIds)
+                    .sort((a, b) => degreeRank.get(a) - degreeRank.get(b))
+                    .slice(0, count);
+            }}
+            const top = [];
+            for (const id of degreeOrder) {{
+                if (!visibleNodeIds.has(id)) continue;
+                top.push(id);
+                if (top.length === count) break;
+            }}
+            return top;
+        }}
 
-            // Area distribution (top 5)
-            const areaCounts = {{}};
-            visibleNodeIds.forEach(id => {{
-                const area = nodeData[id].area;
-                areaCounts[area] = (areaCounts[area] || 0) + 1;
+        function renderBars(containerId, bars) {{
+            // Rows are reused; only those whose label, value or width changed are rewritten
+            const container = document.getElementById(containerId);
+            const max = Math.max(1, ...bars.map(bar => bar.count));
+            while (container.children.length > bars.length) container.lastElementChild.remove();
+            bars.forEach((bar, i) => {{
+                let row = container.children[i];
+                if (!row) {{
+                    row = document.createElement('div');
+                    row.className = 'stats-bar-row';
+                    row.innerHTML = `
+                        <span class="stats-bar-label"></span>
+                        <div class="stats-bar-wrapper">
+                            <div class="stats-bar"></div>
+                        </div>
+                        <span class="stats-bar-value"></span>`;
+                    container.appendChild(row);
+                }}
+                const width = `${{(bar.count / max) * 100}}%`;
+                const state = JSON.stringify([bar.label, bar.title, bar.color, width, bar.count]);
+                if (row.dataset.state === state) return;
+                row.dataset.state = state;
+                const label = row.querySelector('.stats-bar-label');
+                label.textContent = bar.label;
+                label.title = bar.title;
+                const fill = row.querySelector('.stats-bar');
+                fill.style.width = width;
+                fill.style.background = bar.color;
+                row.querySelector('.stats-bar-value').textContent = bar.count;
             }});
+        }}
 
-            const topAreas = Object.entries(areaCounts)
+        function updateStatsPanel() {{
+            // Priority distribution
+            const priorityColors = {{ 'Alta (P0)': '#ff6b6b', 'Media (P1)': '#ffd93d', 'Baja (P2)': '#4ecdc4' }};
+            renderBars('priority-stats', Object.keys(priorityColors).map(label => ({{
+                label: label.replace(' (P0)', '').replace(' (P1)', '').replace(' (P2)', ''),
+                title: label,
+                color: priorityColors[label],
+                count: visibleStats.priority.get(label)
+            }})));
+
+            // Area distribution (top 5)
+            const topAreas = Array.from(visibleStats.area)
+                .filter(([, count]) => count > 0)
                 .sort((a, b) => b[1] - a[1])
                 .slice(0, 5);
-            const maxArea = topAreas.length > 0 ? topAreas[0][1] : 1;
-
-            document.getElementById('area-stats').innerHTML = topAreas.map(([area, count]) => `
-                <div class="stats-bar-row">
-                    <span class="stats-bar-label" title="${{area}}">${{area.substring(0, 12)}}</span>
-                    <div class="stats-bar-wrapper">
-                        <div class="stats-bar" style="width: ${{(count / maxArea) * 100}}%; background: ${{areaColors[area] || '#888'}}"></div>
-                    </div>
-                    <span class="stats-bar-value">${{count}}</span>
+            renderBars('area-stats', topAreas.map(([area, count]) => ({{
+                label: area.substring(0, 12),
+                title: area,
+                color: areaColors[area] || '#888',
+                count
+            }})));
+
+            // Top connected nodes, redrawn only when the list changes
+            const container = document.getElementById('top-connected');
+            const top = topConnected(5);
+            if (container.dataset.ids === top.join(',')) return;
+            container.dataset.ids = top.join(',');
+            container.innerHTML = top.map(id => `
+                <div class="top-connected-item" data-id="${{id}}">
+                    <span class="top-connected-id">${{id}}</span>
+                    <span>${{nodeData[id].funcionalidad.substring(0, 20)}}...</span>
+                    <span class="top-connected-count">${{connectionCount(id)}} conex.</span>
                 </div>
             `).join('');
-
-            // Top connected nodes
-            const connections = Array.from(visibleNodeIds).map(id => ({{
-                id,
-                total: nodeData[id].in_degree + nodeData[id].out_degree
-            }})).sort((a, b) => b.total - a.total).slice(0, 5);
-
-            document.getElementById('top-connected').innerHTML = connections.map(c => `
-                <div class="top-connected-item" data-id="${{c.id}}">
-                    <span class="top-connected-id">${{c.id}}</span>
-                    <span>${{nodeData[c.id].funcionalidad.substring(0, 20)}}...</span>
-                    <span class="top-connected-count">${{c.total}} conex.</span>
-                </div>
-            `).join('');
-
-            // Click handlers for top connected items
-            document.querySelectorAll('.top-connected-item').forEach(item => {{
-                item.addEventListener('click', function() {{
-                    focusOnNode(this.dataset.id);
-                }});
-            }});
         }}
 
         // Export functions
@@ -2565,12 +4157,42 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
             // Info is now hidden via the pinned tooltip
         }}
 
+        // Ancestors/descendants: precomputed lists, or an iterative BFS over the
+        // embedded adjacency (memoised per node and direction)
+        function getReachable(nodeId, direction) {{
+            if (subgraphData) return subgraphData[nodeId]?.[direction] || [];
+
+            const cache = reachableCache[direction];
+            if (cache.has(nodeId)) return cache.get(nodeId);
+
+            const start = adjacencyIndex[nodeId];
+            if (start === undefined) return [];
+            const neighbours = direction === 'ancestors' ? graphAdjacency.in : graphAdjacency.out;
+            const seen = new Uint8Array(graphAdjacency.nodes.length);
+            const queue = [start];
+            seen[start] = 1;
+            for (let head = 0; head < queue.length; head++) {{
+                const adjacent = neighbours[queue[head]];
+                for (let k = 0; k < adjacent.length; k++) {{
+                    const next = adjacent[k];
+                    if (!seen[next]) {{
+                        seen[next] = 1;
+                        queue.push(next);
+                    }}
+                }}
+            }}
+
+            const result = queue.slice(1).map(i => graphAdjacency.nodes[i]);
+            cache.set(nodeId, result);
+            return result;
+        }}
+
         function showAncestors() {{
             if (!selectedNodeId) {{
                 showToast('Primero selecciona un nodo haciendo clic en el grafo', 'warning');
                 return;
             }}
-            const ancestors = subgraphData[selectedNodeId]?.ancestors || [];
+            const ancestors = getReachable(selectedNodeId, 'ancestors');
             visibleNodeIds = new Set([selectedNodeId, ...ancestors]);
             currentViewContext = {{ type: 'ancestors', node: selectedNodeId }};
             updateVisibility();
@@ -2586,7 +4208,7 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 showToast('Primero selecciona un nodo haciendo clic en el grafo', 'warning');
                 return;
             }}
-            const descendants = subgraphData[selectedNodeId]?.descendants || [];
+            const descendants = getReachable(selectedNodeId, 'descendants');
             visibleNodeIds = new Set([selectedNodeId, ...descendants]);
             currentViewContext = {{ type: 'descendants', node: selectedNodeId }};
             updateVisibility();
@@ -2603,9 +4225,9 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 return;
             }}
             const neighbors = new Set([selectedNodeId]);
-            edges.get().forEach(edge => {{
-                if (edge.from === selectedNodeId) neighbors.add(edge.to);
-                if (edge.to === selectedNodeId) neighbors.add(edge.from);
+            (incidentEdges.get(selectedNodeId) || []).forEach(edge => {{
+                neighbors.add(edge.from);
+                neighbors.add(edge.to);
             }});
             visibleNodeIds = neighbors;
             currentViewContext = {{ type: 'neighborhood', node: selectedNodeId }};
@@ -2705,32 +4327,27 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
                 if (ganttVersionSection) ganttVersionSection.style.display = 'none';
 
                 if (layout === 'tree') {{
+                    // Layered positions computed at build time: only nodes move
                     network.setOptions({{
-                        layout: {{
-                            hierarchical: {{
-                                enabled: true,
-                                direction: 'UD',
-                                sortMethod: 'directed',
-                                levelSeparation: 150,
-                                nodeSpacing: 180,
-                                treeSpacing: 220,
-                                blockShifting: true,
-                                edgeMinimization: true,
-                                parentCentralization: true,
-                                shakeTowards: 'roots'
-                            }}
-                        }},
                         physics: {{
                             enabled: false
                         }}
                     }});
+                    nodes.update(Object.keys(treePositions).map(id => ({{
+                        id: id,
+                        x: treePositions[id][0],
+                        y: treePositions[id][1]
+                    }})));
+                }} else if (precomputedLayout) {{
+                    // Back to the positions computed at build time
+                    network.setOptions({{
+                        physics: {{
+                            enabled: false
+                        }}
+                    }});
+                    nodes.update(forcePositions);
                 }} else {{
                     network.setOptions({{
-                        layout: {{
-                            hierarchical: {{
-                                enabled: false
-                            }}
-                        }},
                         physics: {{
                             enabled: true,
                             solver: 'forceAtlas2Based',
@@ -2754,9 +4371,7 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
 
         function resetView() {{
             // Clear filters
-            document.getElementById('area-filter').value = '';
-            document.getElementById('priority-filter').value = '';
-            document.getElementById('version-filter').value = '';
+            facetFilters.forEach(filter => setFacetValues(filter, []));
             document.getElementById('node-search').value = '';
 
             // Show all nodes
@@ -2808,52 +4423,400 @@ def inject_custom_controls(html_path: str, G: nx.DiGraph, title: str, gantt_data
     <script src="https://cdn.jsdelivr.net/npm/frappe-gantt@0.6.1/dist/frappe-gantt.umd.min.js"></script>
     """
 
+    # Multi-select filters: the tom-select bundle pyvis ships in lib/
+    if cdn_resources == 'local':
+        tom_select_assets = """
+    <link rel="stylesheet" href="lib/tom-select/tom-select.css">
+    <script src="lib/tom-select/tom-select.complete.min.js"></script>
+    """
+    else:
+        tom_select_assets = """
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/tom-select/2.0.0-rc.4/css/tom-select.min.css">
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/tom-select/2.0.0-rc.4/js/tom-select.complete.js"></script>
+    """
+
+    # Locate the splice points once, then emit the parts in order
+    head_end = base_html.find('</head>')
+    body_start = base_html.find('<body>', head_end)
+    card_div_start = base_html.find('<div class="card"', body_start) if body_start != -1 else -1
+    script_start = base_html.find('<script type="text/javascript">', body_start) if body_start != -1 else -1
+    body_end = base_html.rfind('</body>')
+
+    if head_end == -1:
+        yield base_html
+        return
+
+    yield base_html[:head_end]
+    yield gantt_cdn
+    yield tom_select_assets
+    yield custom_css
+
+    if -1 in (body_start, card_div_start, script_start, body_end):
+        # Unexpected template: keep pyvis' body, only add our styles
+        yield base_html[head_end:]
+        return
+
     # Remove pyvis default card structure and replace body content
-    html_content = html_content.replace('</head>', gantt_cdn + custom_css + '</head>')
+    yield base_html[head_end:body_start + 6]
+    yield custom_html
+    yield base_html[script_start:body_end]
+    yield from iter_data_script()
+    yield custom_js
+    if live_reload_url:
+        yield f"""
+    <script>
+    new EventSource({json.dumps(live_reload_url)}).addEventListener('reload', () => window.location.reload());
+    </script>
+    """
+    yield '</body></html>'
+
 
-    # Find the body tag and insert our HTML
-    body_start = html_content.find('<body>')
-    if body_start != -1:
-        # Find where the card div ends to extract just the script content
-        card_div_start = html_content.find('<div class="card"', body_start)
-        if card_div_start != -1:
-            # We need to keep the scripts but replace the HTML structure
-            script_start = html_content.find('<script type="text/javascript">', body_start)
-            body_end = html_content.find('</body>')
+def build_digest(csv_path: str, gantt_path: Optional[str], options: dict) -> str:
+    """Digest of everything that determines the generated page.
 
-            if script_start != -1 and body_end != -1:
-                scripts = html_content[script_start:body_end]
-                html_content = html_content[:body_start + 6] + custom_html + scripts + custom_js + '</body></html>'
+    Covers the requirements CSV, the optional Gantt CSV, the CLI options and
+    the running code (``SOURCE_DIGEST``), so any code change invalidates old
+    builds.
+    """
+    digest = hashlib.sha256()
+    digest.update(SOURCE_DIGEST.encode('ascii'))
+    for path in (csv_path, gantt_path):
+        digest.update(b'\0')
+        if path:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """On-disk cache of generated pages keyed by ``build_digest``.
+
+    Entries are plain ``<digest>.html`` files. Their mtime is refreshed on
+    every hit, and eviction drops entries older than ``max_age_days`` and then
+    the least recently used ones until the cache fits in ``max_bytes``.
+
+    The last ``analyze_graph`` result for each requirements CSV is kept next
+    to the pages (``analysis-<path hash>.pickle``) so edits to that file can
+    be rebuilt incrementally; these files are evicted like pages.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = CACHE_MAX_BYTES,
+                 max_age_days: float = CACHE_MAX_AGE_DAYS):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+
+    def _entry(self, digest: str) -> Path:
+        return self.directory / f'{digest}.html'
+
+    def fetch(self, digest: str, output_path: str) -> bool:
+        """Copy a cached page to ``output_path``; False on a cache miss."""
+        entry = self._entry(digest)
+        if not entry.exists():
+            return False
+        copy_local_assets(Path(output_path).resolve().parent)
+        try:
+            shutil.copyfile(entry, output_path)
+            os.utime(entry)
+        except FileNotFoundError:
+            # Evicted by a concurrent build
+            return False
+        return True
+
+    def store(self, digest: str, output_path: str):
+        """Add a freshly generated page to the cache, then evict."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self._entry(digest)
+        partial = entry.with_suffix(f'.{os.getpid()}.tmp')
+        shutil.copyfile(output_path, partial)
+        os.replace(partial, entry)
+        self.evict()
+
+    def _analysis_entry(self, csv_path: str) -> Path:
+        key = hashlib.sha256(str(Path(csv_path).resolve()).encode('utf-8')).hexdigest()[:32]
+        return self.directory / f'analysis-{key}.pickle'
+
+    def load_analysis(self, csv_path: str) -> Optional[dict]:
+        """Analysis saved by the last build of ``csv_path``, if still usable.
+
+        Analyses written by a different version of this script are ignored.
+        """
+        entry = self._analysis_entry(csv_path)
+        try:
+            with open(entry, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if state.get('source') != SOURCE_DIGEST:
+            return None
+        os.utime(entry)
+        return state
+
+    def store_analysis(self, csv_path: str, analysis: dict):
+        """Save ``analysis`` for the next build of ``csv_path``.
+
+        The closure is only kept when its lists were embedded in the page,
+        which is the case it speeds up.
+        """
+        state = {key: analysis[key] for key in ('nodes', 'edges', 'options', 'levels', 'cycle_info', 'fragments',
+                                                'tree_layout', 'layout_iterations', 'layout')}
+        state['reachability'] = analysis['reachability'] if analysis['fragments']['subgraphData'] else None
+        state['source'] = SOURCE_DIGEST
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self._analysis_entry(csv_path)
+        partial = entry.with_suffix(f'.{os.getpid()}.tmp')
+        with open(partial, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, entry)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        cutoff = time.time() - self.max_age_days * 86400
+        for entry in [*self.directory.glob('*.html'), *self.directory.glob('analysis-*.pickle')]:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Evicted by another build since the glob
+                continue
+            if stat.st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
 
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
 
+class StageProfiler:
+    """Wall time, CPU time and tracemalloc peak of each pipeline stage.
+
+    Stages are opened with ``profile_stage`` while the profiler is active
+    (see ``activate``) and may nest. A stage's peak is how far traced memory
+    rose above what was in use when the stage opened, at any point while it
+    was open (children included), so memory left over from imports and
+    earlier stages does not count.
+    """
 
-def main():
+    active: Optional['StageProfiler'] = None
+
+    def __init__(self):
+        self.stages = []
+        self._open = []
+        self._started = None
+        self.total = None
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator['StageProfiler']:
+        """Trace allocations and collect stages until the block exits."""
+        import tracemalloc
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._started = (time.perf_counter(), time.process_time())
+        baseline = tracemalloc.get_traced_memory()[0]
+        previous, StageProfiler.active = StageProfiler.active, self
+        try:
+            yield self
+        finally:
+            StageProfiler.active = previous
+            self.total = {
+                'wall': time.perf_counter() - self._started[0],
+                'cpu': time.process_time() - self._started[1],
+                'peak_bytes': max([tracemalloc.get_traced_memory()[1]]
+                                  + [stage['peak_bytes'] + stage['baseline_bytes'] for stage in self.stages])
+                - baseline,
+            }
+            if not tracing:
+                tracemalloc.stop()
+
+    def _fold_peak(self):
+        """Credit the (absolute) peak since the last reset to every open stage."""
+        import tracemalloc
+        peak = tracemalloc.get_traced_memory()[1]
+        for stage in self._open:
+            stage['peak_bytes'] = max(stage['peak_bytes'], peak)
+        tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        import tracemalloc
+        self._fold_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        stage = {'name': name, 'depth': len(self._open), 'wall': 0.0, 'cpu': 0.0, 'peak_bytes': baseline,
+                 'baseline_bytes': baseline}
+        self.stages.append(stage)
+        self._open.append(stage)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stage['wall'] = time.perf_counter() - wall
+            stage['cpu'] = time.process_time() - cpu
+            self._fold_peak()
+            self._open.remove(stage)
+            stage['peak_bytes'] -= baseline
+
+    def summary(self) -> str:
+        """The stages as a text table, nested stages indented."""
+        lines = [f"{'stage':<24} {'wall (s)':>9} {'cpu (s)':>9} {'peak (MiB)':>11}"]
+        for stage in self.stages + [dict(self.total, name='total', depth=0)]:
+            name = '  ' * stage['depth'] + stage['name']
+            lines.append(f"{name:<24} {stage['wall']:>9.3f} {stage['cpu']:>9.3f} "
+                         f"{stage['peak_bytes'] / (1 << 20):>11.1f}")
+        return '\n'.join(lines)
+
+    def to_json(self) -> dict:
+        return {'stages': self.stages, 'total': self.total}
+
+
+def profile_stage(name: str) -> contextlib.AbstractContextManager:
+    """Record ``name`` with the active ``StageProfiler``; a no-op when not profiling."""
+    profiler = StageProfiler.active
+    return profiler.stage(name) if profiler is not None else contextlib.nullcontext()
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that need at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
+def import_dependencies():
+    """Import the heavy modules that the build stages otherwise load lazily."""
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import networkx  # noqa: F401
+    import pyvis.network  # noqa: F401
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description='Create interactive requirements graph visualization')
-    parser.add_argument('csv_file', help='Path to requirements CSV file')
+    parser.add_argument('csv_file', nargs='?', help='Path to requirements CSV file')
     parser.add_argument('--output', '-o', default='requirements_interactive.html', help='Output HTML file')
     parser.add_argument('--title', '-t', default='Requirements Dependency Graph', help='Graph title')
     parser.add_argument('--highlight', help='Node ID to highlight')
     parser.add_argument('--gantt', '-g', help='Optional Gantt timeline CSV file with start/end dates')
+    parser.add_argument('--max-cycles', type=int, default=10,
+                        help='Maximum number of dependency cycles to embed in the page (default: 10)')
+    parser.add_argument('--cycle-time-budget', type=float, default=2.0,
+                        help='Seconds to spend enumerating dependency cycles (default: 2.0)')
+    parser.add_argument('--subgraph-mode', choices=SUBGRAPH_MODES, default='auto',
+                        help='Embed precomputed ancestor/descendant lists (closure), adjacency lists '
+                             'traversed in the browser (adjacency), or pick by size (auto, default)')
+    parser.add_argument('--precompute-layout', action='store_true',
+                        help='Compute force-directed node positions at build time and open the page '
+                             'with physics off, instead of stabilizing the layout in the browser')
+    parser.add_argument('--layout-iterations', type=positive_int, default=DEFAULT_LAYOUT_ITERATIONS,
+                        help=f'Iterations of the precomputed layout (default: {DEFAULT_LAYOUT_ITERATIONS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always regenerate, ignoring and not updating the build cache')
+    parser.add_argument('--cache-dir',
+                        help=f'Build cache directory (default: ${CACHE_DIR_ENV} or {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--csv-engine', choices=CSV_ENGINES, default='auto',
+                        help='Read CSVs with pandas, the stdlib csv module, or pick by file size '
+                             f'(auto, default: stdlib up to {CSV_FAST_PATH_MAX_BYTES // 1024} KiB)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Rebuild when the input CSVs change and reload open pages')
+    parser.add_argument('--reload-port', type=int, default=DEFAULT_RELOAD_PORT,
+                        help=f'Local port for live reload events in --watch mode (default: {DEFAULT_RELOAD_PORT})')
+    parser.add_argument('--batch', metavar='MANIFEST_OR_GLOB',
+                        help='Render many pages: a JSON manifest of jobs or a glob of CSV files')
+    parser.add_argument('--jobs', '-j', type=positive_int, default=os.cpu_count() or 1,
+                        help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run a render daemon that keeps modules loaded and serves later builds')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Render in this process even if a daemon is running')
+    parser.add_argument('--daemon-socket',
+                        help=f'Unix socket of the render daemon (default: ${DAEMON_SOCKET_ENV}, or '
+                             f'{DAEMON_SOCKET_NAME} in $XDG_RUNTIME_DIR or a private temp directory)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Print wall time, CPU time and peak traced memory of each build stage')
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help='Also write the stage profile to this JSON file (implies --profile)')
+    parser.add_argument('--profile-stats', metavar='PATH',
+                        help='Also write cProfile statistics for the build to this file, '
+                             'for pstats or snakeviz (implies --profile)')
+    return parser
+
+
+def build(args: argparse.Namespace, cache: Optional[BuildCache] = None,
+          previous: Optional[dict] = None) -> dict:
+    """Load the inputs named in ``args`` and write the interactive page.
+
+    The previous analysis of the same CSV (``previous``, or else the one in
+    ``cache``) is reused where the graph has not changed. Returns this build's
+    analysis, which is also saved to ``cache`` for the next run.
+    """
+    G, gantt_data, gantt_versions = load_inputs(args)
+
+    analysis = analyze_graph(
+        G,
+        previous=previous if previous is not None or cache is None else cache.load_analysis(args.csv_file),
+        **analysis_options(args),
+    )
+    if analysis['stale'] is not None:
+        print(f"Reused previous analysis ({len(analysis['stale'])} node(s) with changed dependencies)")
+
+    render_page(args, G, gantt_data, gantt_versions, analysis)
+
+    if cache is not None:
+        cache.store_analysis(args.csv_file, analysis)
+    return analysis
 
-    args = parser.parse_args()
 
+def analysis_options(args: argparse.Namespace) -> dict:
+    """``analyze_graph`` keyword arguments for the parsed CLI ``args``."""
+    return {
+        'max_cycles': args.max_cycles,
+        'cycle_time_budget': args.cycle_time_budget,
+        'reachability': args.subgraph_mode != 'adjacency',
+        'layout_iterations': args.layout_iterations if args.precompute_layout else 0,
+    }
+
+
+def load_inputs(args: argparse.Namespace) -> tuple:
+    """Read the CSVs named in ``args``: ``(graph, gantt_data, gantt_versions)``."""
     print(f"Loading requirements from: {args.csv_file}")
-    df = load_requirements(args.csv_file)
-    print(f"Loaded {len(df)} requirements")
+    stdlib = use_stdlib_csv(args.csv_file, args.csv_engine)
+    with profile_stage('csv_load'):
+        rows = load_requirement_rows(args.csv_file) if stdlib else load_requirements(args.csv_file)
+    with profile_stage('dependency_parse'):
+        dependencies = parse_dependency_rows(rows) if stdlib else parse_dependency_column(rows)
+    with profile_stage('graph_build'):
+        G = build_graph_from_rows(rows, dependencies) if stdlib else build_graph(rows, dependencies)
+    print(f"Loaded {len(rows)} requirements with {len(dependencies)} dependency references")
 
     # Load Gantt data if provided
     gantt_data = {}
     gantt_versions = []
     if args.gantt:
         print(f"Loading Gantt timeline from: {args.gantt}")
-        gantt_data, gantt_versions = load_gantt_timelines(args.gantt)
+        with profile_stage('gantt_load'):
+            if use_stdlib_csv(args.gantt, args.csv_engine):
+                gantt_data, gantt_versions = load_gantt_rows(args.gantt)
+            else:
+                gantt_data, gantt_versions = load_gantt_timelines(args.gantt)
         print(f"Loaded {len(gantt_versions)} timeline version(s): {', '.join(gantt_versions)}")
 
-    G = build_graph(df)
     print(f"Built graph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
+    return G, gantt_data, gantt_versions
 
+
+def render_page(args: argparse.Namespace, G: nx.DiGraph, gantt_data: dict, gantt_versions: list,
+                analysis: dict):
+    """Write the page for ``args`` from already loaded and analysed inputs."""
     create_interactive_graph(
         G,
         title=args.title,
@@ -2861,8 +4824,548 @@ def main():
         highlight_node=args.highlight,
         gantt_data=gantt_data,
         gantt_versions=gantt_versions,
+        max_cycles=args.max_cycles,
+        cycle_time_budget=args.cycle_time_budget,
+        subgraph_mode=args.subgraph_mode,
+        analysis=analysis,
+        live_reload_url=f'http://127.0.0.1:{args.reload_port}/events' if args.watch else None,
     )
 
 
+def build_cached(args: argparse.Namespace, cache: Optional[BuildCache],
+                 previous: Optional[dict] = None) -> Optional[dict]:
+    """``build`` unless ``cache`` already holds this exact page.
+
+    Returns the build's analysis, or ``previous`` on a cache hit.
+    """
+    if cache is None:
+        return build(args, previous=previous)
+
+    options = {k: v for k, v in vars(args).items() if k not in NON_CONTENT_ARGS}
+    digest = build_digest(args.csv_file, args.gantt, options)
+    if cache.fetch(digest, args.output):
+        print(f"Inputs unchanged, reused cached build: {args.output}")
+        return previous
+
+    analysis = build(args, cache, previous)
+    cache.store(digest, args.output)
+    return analysis
+
+
+def batch_jobs(spec: str, base: argparse.Namespace) -> List[argparse.Namespace]:
+    """Expand a ``--batch`` spec into one argument namespace per page.
+
+    ``spec`` is either a JSON manifest or a glob of requirement CSVs. Glob
+    matches use the other CLI options as given and write ``<csv stem>.html``
+    next to each CSV. A manifest looks like::
+
+        {"defaults": {"gantt": "timelines.csv", "max_cycles": 20},
+         "jobs": [{"csv": "line_a.csv", "output": "line_a.html",
+                   "highlight": ["RM-001", "RM-004"]},
+                  {"csv": "line_b.csv"}]}
+
+    where keys are CLI option names (``csv`` is the requirements CSV) and
+    relative paths are taken from the manifest's directory. A list of
+    ``highlight`` IDs renders one variant per ID, named ``<output stem>-<ID>.html``.
+    """
+    import copy
+    import glob
+
+    def job_args(options: dict) -> argparse.Namespace:
+        args = copy.copy(base)
+        args.batch = None
+        for key, value in options.items():
+            key = key.replace('-', '_')
+            if not hasattr(args, key):
+                raise ValueError(f"{spec}: unknown option {key!r}")
+            setattr(args, key, value)
+        return args
+
+    if not spec.endswith('.json'):
+        paths = sorted(glob.glob(spec))
+        if not paths:
+            raise ValueError(f"{spec}: no CSV files match")
+        return [job_args({'csv_file': path, 'output': str(Path(path).with_suffix('.html'))}) for path in paths]
+
+    root = Path(spec).parent
+    with open(spec, encoding='utf-8') as f:
+        manifest = json.load(f)
+    jobs = []
+    for entry in manifest['jobs']:
+        options = {**manifest.get('defaults', {}), **entry}
+        options['csv_file'] = str(root / options.pop('csv'))
+        for key in ('gantt', 'output'):
+            if options.get(key):
+                options[key] = str(root / options[key])
+        # The CSV path already includes the manifest's directory
+        if not options.get('output'):
+            options['output'] = str(Path(options['csv_file']).with_suffix('.html'))
+
+        highlights = options.pop('highlight', None)
+        if not isinstance(highlights, list):
+            jobs.append(job_args({**options, 'highlight': highlights}))
+            continue
+        output = Path(options['output'])
+        for node_id in highlights:
+            variant = output.with_name(f'{output.stem}-{node_id}{output.suffix}')
+            jobs.append(job_args({**options, 'highlight': node_id, 'output': str(variant)}))
+    return jobs
+
+
+def analysis_key(args: argparse.Namespace) -> tuple:
+    """Options that determine ``load_inputs`` and ``analyze_graph`` results."""
+    return (args.csv_file, args.gantt, args.csv_engine) + tuple(analysis_options(args).values())
+
+
+def prepare_batch_input(args: argparse.Namespace) -> tuple:
+    """Worker: load and analyse one input shared by every page rendered from it."""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        G, gantt_data, gantt_versions = load_inputs(args)
+        analysis = analyze_graph(G, **analysis_options(args))
+    return (G, gantt_data, gantt_versions, analysis), time.perf_counter() - started
+
+
+def render_batch_job(args: argparse.Namespace, inputs: tuple) -> float:
+    """Worker: render one page from prepared inputs; returns its wall time."""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        render_page(args, *inputs)
+    return time.perf_counter() - started
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Render every page of ``args.batch`` on ``args.jobs`` worker processes.
+
+    Inputs shared by several pages (e.g. ``highlight`` variants) are loaded
+    and analysed once and handed to the render jobs. A failing job is
+    reported and the rest of the batch continues. Returns the exit status.
+    The build cache is not used.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    started = time.perf_counter()
+    try:
+        jobs = batch_jobs(args.batch, args)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"Invalid batch: {exc}")
+        return 1
+
+    # Copy lib/ once per output directory here rather than in every worker
+    try:
+        for directory in sorted({Path(job.output).resolve().parent for job in jobs}):
+            copy_local_assets(directory)
+    except OSError as exc:
+        print(f"Could not copy page assets: {exc}")
+        return 1
+
+    groups = {}
+    for job in jobs:
+        groups.setdefault(analysis_key(job), []).append(job)
+    print(f"Batch: {len(jobs)} page(s) from {len(groups)} input(s) on {args.jobs} worker(s)")
+
+    failures = 0
+
+    def report(job: argparse.Namespace, status: str, detail: str):
+        print(f"  {status:<4}  {job.output:<40}  {detail}")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        prepared = {pool.submit(prepare_batch_input, group[0]): group for group in groups.values()}
+        rendered = {}
+        for future in as_completed(prepared):
+            group = prepared[future]
+            try:
+                inputs, prepare_time = future.result()
+            except Exception as exc:
+                for job in group:
+                    failures += 1
+                    report(job, 'FAIL', f"{job.csv_file}: {type(exc).__name__}: {exc}")
+                continue
+            for job in group:
+                rendered[pool.submit(render_batch_job, job, inputs)] = (job, prepare_time, len(group))
+
+        for future in as_completed(rendered):
+            job, prepare_time, shared_by = rendered[future]
+            try:
+                render_time = future.result()
+            except Exception as exc:
+                failures += 1
+                report(job, 'FAIL', f"{type(exc).__name__}: {exc}")
+                continue
+            shared = f" (shared by {shared_by})" if shared_by > 1 else ""
+            report(job, 'OK', f"load+analysis {prepare_time:.2f}s{shared}, render {render_time:.2f}s")
+
+    print(f"Rendered {len(jobs) - failures}/{len(jobs)} page(s) in {time.perf_counter() - started:.2f}s")
+    return 1 if failures else 0
+
+
+class ReloadServer:
+    """Minimal Server-Sent Events endpoint that tells open pages to reload.
+
+    Pages built in watch mode subscribe to ``/events``; every ``broadcast``
+    sends a ``reload`` event to all of them. Pages are usually opened from
+    ``file://``, so the endpoint allows any origin.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_RELOAD_PORT):
+        self.host = host
+        self.port = port
+        self.clients = set()
+        self._server = None
+
+    async def start(self):
+        import asyncio
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self.clients):
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+        if not request_line.startswith(b'GET /events'):
+            writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+            await writer.drain()
+            writer.close()
+            return
+
+        writer.write(
+            b'HTTP/1.1 200 OK\r\n'
+            b'Content-Type: text/event-stream\r\n'
+            b'Cache-Control: no-cache\r\n'
+            b'Access-Control-Allow-Origin: *\r\n'
+            b'Connection: keep-alive\r\n\r\n'
+            b'retry: 1000\n\n'
+        )
+        await writer.drain()
+        self.clients.add(writer)
+        try:
+            # Returns at EOF, when the page is closed or reloaded
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    async def broadcast(self):
+        message = f'event: reload\ndata: {time.time():.0f}\n\n'.encode('ascii')
+        for writer in list(self.clients):
+            try:
+                writer.write(message)
+                await writer.drain()
+            except ConnectionError:
+                self.clients.discard(writer)
+                writer.close()
+
+
+def input_signature(paths: List[str]) -> tuple:
+    """(mtime, size) of each path, ``None`` for files that are missing right now."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+async def watch_inputs(args: argparse.Namespace, cache: Optional[BuildCache]):
+    """Build, then rebuild and reload open pages whenever the input CSVs change.
+
+    Inputs are polled every ``WATCH_POLL_INTERVAL`` seconds. Spreadsheet tools
+    often write a file several times per save, so a rebuild only starts once
+    the inputs have been stable for ``WATCH_DEBOUNCE`` seconds. Builds run in a
+    worker thread to keep the reload endpoint responsive, and the analysis is
+    kept in memory between them.
+    """
+    import asyncio
+    paths = [path for path in (args.csv_file, args.gantt) if path]
+    loop = asyncio.get_running_loop()
+    server = ReloadServer(port=args.reload_port)
+    await server.start()
+    try:
+        seen = input_signature(paths)
+        analysis = await loop.run_in_executor(None, build_cached, args, cache, None)
+        print(f"Watching {', '.join(paths)} for changes (live reload on port {args.reload_port}, Ctrl+C to stop)")
+
+        while True:
+            await asyncio.sleep(WATCH_POLL_INTERVAL)
+            current = input_signature(paths)
+            if current == seen:
+                continue
+            while True:
+                await asyncio.sleep(WATCH_DEBOUNCE)
+                settled = input_signature(paths)
+                if settled == current:
+                    break
+                current = settled
+            seen = current
+            if None in current:
+                continue
+
+            started = time.perf_counter()
+            try:
+                analysis = await loop.run_in_executor(None, build_cached, args, cache, analysis)
+            except Exception as exc:
+                # A half-saved or invalid CSV should not end the session
+                print(f"Rebuild failed: {exc}")
+                continue
+            print(f"Rebuilt in {time.perf_counter() - started:.2f}s, reloading {len(server.clients)} page(s)")
+            await server.broadcast()
+    finally:
+        await server.close()
+
+
+def daemon_socket_path(args: argparse.Namespace) -> Path:
+    """The render daemon's socket: ``--daemon-socket``, ``$REQVIZ_SOCKET`` or the default.
+
+    The default is in ``$XDG_RUNTIME_DIR``, or else in a per-user directory
+    under the temp dir that only the user can enter. An existing directory
+    of that name that is not the user's own, or that others can access, is
+    refused with ``PermissionError`` rather than trusted.
+    """
+    explicit = args.daemon_socket or os.environ.get(DAEMON_SOCKET_ENV)
+    if explicit:
+        return Path(explicit)
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / DAEMON_SOCKET_NAME
+
+    directory = Path(tempfile.gettempdir()) / f'requirements-viz-{os.getuid()}'
+    directory.mkdir(mode=0o700, exist_ok=True)
+    info = directory.lstat()
+    if directory.is_symlink() or not directory.is_dir() or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} is not a private directory of the current user")
+    return directory / DAEMON_SOCKET_NAME
+
+
+class DaemonOutput(io.TextIOBase):
+    """Text stream that forwards writes to a daemon client as JSON lines."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self.wfile.write(json.dumps({'output': text}).encode('utf-8') + b'\n')
+        return len(text)
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Run one CLI invocation sent by ``render_via_daemon``.
+
+    The request is a JSON line with ``argv``, ``cwd`` and the client's
+    ``source`` digest; output is streamed back as ``{"output": ...}`` lines,
+    followed by ``{"status": <exit code>}``. Jobs run one at a time, in the
+    client's working directory. A job from a client whose source differs
+    from the daemon's is answered with ``{"refused": ...}`` instead.
+    """
+
+    def handle(self):
+        job = json.loads(self.rfile.readline())
+        if job.get('source') != SOURCE_DIGEST:
+            reason = 'the daemon runs a different version of this script; restart it with --daemon'
+            self.wfile.write(json.dumps({'refused': reason}).encode('utf-8') + b'\n')
+            return
+        output = DaemonOutput(self.wfile)
+        status = 0
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(job['cwd'])
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                try:
+                    run(build_parser().parse_args(job['argv']))
+                except SystemExit as exc:
+                    status = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+        finally:
+            os.chdir(previous_cwd)
+        self.wfile.write(json.dumps({'status': status}).encode('utf-8') + b'\n')
+
+
+def warm_up():
+    """Import the dependencies and compile pyvis' page template ahead of the first build.
+
+    Renders a one-node page in memory; the compiled template is kept in the
+    process-wide ``TEMPLATE_ENVIRONMENTS``.
+    """
+    import networkx as nx
+    import_dependencies()
+    G = nx.DiGraph()
+    G.add_node('RM-001')
+    render_to_string(G)
+
+
+def serve_daemon(socket_path: Path):
+    """Serve render jobs on ``socket_path`` until interrupted.
+
+    The socket is only accessible to the current user, since jobs write
+    files with the daemon's permissions. Dependencies are loaded and the
+    page template compiled (``warm_up``) before the socket is bound, so the
+    first job is as fast as later ones.
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        if render_via_daemon(None, socket_path) is not None:
+            sys.exit(f"A render daemon is already listening on {socket_path}")
+        socket_path.unlink()
+
+    warm_up()
+    previous_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(str(socket_path), DaemonRequestHandler)
+    finally:
+        os.umask(previous_umask)
+
+    print(f"Render daemon listening on {socket_path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Render daemon stopped")
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def render_via_daemon(argv: Optional[List[str]], socket_path: Path) -> Optional[int]:
+    """Send a CLI invocation to a running daemon and relay its output.
+
+    Returns the job's exit status, or ``None`` if no daemon answered (or it
+    refused a job from a different version of this script) so the caller
+    can render in-process. ``argv=None`` only checks that a daemon is
+    listening.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(socket_path))
+    except OSError:
+        return None
+
+    with client, client.makefile('rb') as replies:
+        if argv is None:
+            return 0
+        job = {'argv': argv, 'cwd': os.getcwd(), 'source': SOURCE_DIGEST}
+        client.sendall(json.dumps(job).encode('utf-8') + b'\n')
+        answered = False
+        for line in replies:
+            reply = json.loads(line)
+            if 'refused' in reply:
+                print(f"Render daemon on {socket_path} refused the job: {reply['refused']}")
+                return None
+            if 'status' in reply:
+                return reply['status']
+            sys.stdout.write(reply['output'])
+            answered = True
+    # The daemon went away mid-job; retry in-process unless it already did work
+    return 1 if answered else None
+
+
+def run(args: argparse.Namespace):
+    """Build, or watch and rebuild, as requested by the parsed CLI ``args``."""
+    cache = None
+    if not args.no_cache:
+        cache = BuildCache(args.cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+    if args.watch:
+        import asyncio
+        try:
+            asyncio.run(watch_inputs(args, cache))
+        except KeyboardInterrupt:
+            print("Stopped watching")
+        return
+
+    if args.profile or args.profile_json or args.profile_stats:
+        profile_build(args, cache)
+        return
+
+    build_cached(args, cache)
+
+
+def profile_build(args: argparse.Namespace, cache: Optional[BuildCache]):
+    """``build`` under a ``StageProfiler`` (and cProfile with ``--profile-stats``).
+
+    The page cache is bypassed so every stage runs; a previous analysis is
+    still reused as in a normal build. The lazily imported dependencies are
+    loaded first, in their own ``imports`` stage, so their import time is not
+    charged to whichever stage happens to need them first. Tracing
+    allocations slows the build down, so compare profiles with each other
+    rather than with plain runs.
+    """
+    import cProfile
+    profiler = StageProfiler()
+    stats = cProfile.Profile() if args.profile_stats else None
+    with profiler.activate():
+        if stats is not None:
+            stats.enable()
+        try:
+            with profile_stage('imports'):
+                import_dependencies()
+            build(args, cache)
+        finally:
+            if stats is not None:
+                stats.disable()
+
+    print(profiler.summary())
+    if args.profile_json:
+        Path(args.profile_json).write_text(json.dumps(profiler.to_json(), indent=2), encoding='utf-8')
+        print(f"Stage profile written to: {args.profile_json}")
+    if stats is not None:
+        stats.dump_stats(args.profile_stats)
+        print(f"cProfile statistics written to: {args.profile_stats}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args = parser.parse_args(argv)
+
+    if args.daemon:
+        if not hasattr(socket, 'AF_UNIX'):
+            parser.error('--daemon needs Unix domain sockets')
+        try:
+            socket_path = daemon_socket_path(args)
+        except OSError as exc:
+            sys.exit(f"Cannot place the daemon socket: {exc}")
+        serve_daemon(socket_path)
+        return
+    if args.batch:
+        sys.exit(run_batch(args))
+    if args.csv_file is None:
+        parser.error('the following arguments are required: csv_file')
+    if args.watch and (args.profile or args.profile_json or args.profile_stats):
+        parser.error('--profile cannot be combined with --watch')
+
+    if not (args.no_daemon or args.watch) and hasattr(socket, 'AF_UNIX'):
+        try:
+            socket_path = daemon_socket_path(args)
+        except OSError as exc:
+            print(f"Not using the render daemon: {exc}")
+            socket_path = None
+        if args.cache_dir is None and os.environ.get(CACHE_DIR_ENV):
+            # The daemon has its own environment
+            argv += ['--cache-dir', os.environ[CACHE_DIR_ENV]]
+        status = render_via_daemon(argv, socket_path) if socket_path is not None else None
+        if status:
+            sys.exit(status)
+        if status is not None:
+            return
+
+    run(args)
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,27 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from requirements_interactive import batch_jobs, build_parser
+
+
+def test_manifest_paths_are_rooted_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'manifest.json').write_text(json.dumps({
+        'jobs': [{'csv': 'm1.csv'}, {'csv': 'm2.csv', 'output': 'out/m2.html'}],
+    }), encoding='utf-8')
+    base = build_parser().parse_args(['--batch', 'sub/manifest.json'])
+
+    jobs = batch_jobs('sub/manifest.json', base)
+
+    assert [Path(job.csv_file) for job in jobs] == [Path('sub/m1.csv'), Path('sub/m2.csv')]
+    assert [Path(job.output) for job in jobs] == [Path('sub/m1.html'), Path('sub/out/m2.html')]
+
+
+@pytest.mark.parametrize('jobs', ['0', '-2'])
+def test_jobs_must_be_positive(jobs, capsys):
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(['--batch', '*.csv', '--jobs', jobs])
+    assert 'must be at least 1' in capsys.readouterr().err
@@ -0,0 +1,48 @@
+import networkx as nx
+import pytest
+
+from requirements_interactive import ReachabilityIndex
+
+
+def random_graph(n: int, p: float, seed: int) -> nx.DiGraph:
+    G = nx.gnp_random_graph(n, p, seed=seed, directed=True)
+    G = nx.relabel_nodes(G, {i: f'RM-{i:03d}' for i in G})
+    G.add_edge('RM-000', 'RM-000')
+    return G
+
+
+@pytest.mark.parametrize('n, p, seed', [(1, 0.0, 0), (30, 0.03, 1), (60, 0.05, 2), (200, 0.01, 3)])
+def test_closure_matches_networkx(n, p, seed):
+    G = random_graph(n, p, seed)
+
+    index = ReachabilityIndex(G)
+
+    for node in G:
+        ancestors, descendants = nx.ancestors(G, node), nx.descendants(G, node)
+        assert set(index.ancestors(node)) == ancestors
+        assert set(index.descendants(node)) == descendants
+        assert index.ancestor_count(node) == len(ancestors)
+        assert index.descendant_count(node) == len(descendants)
+    for other in list(G)[:10]:
+        assert index.is_ancestor(other, 'RM-000') == (other in nx.ancestors(G, 'RM-000'))
+
+
+def test_cycle_members_exclude_themselves():
+    G = nx.DiGraph([('RM-001', 'RM-002'), ('RM-002', 'RM-003'), ('RM-003', 'RM-001'), ('RM-003', 'RM-004')])
+
+    index = ReachabilityIndex(G)
+
+    assert sorted(index.descendants('RM-001')) == ['RM-002', 'RM-003', 'RM-004']
+    assert sorted(index.ancestors('RM-004')) == ['RM-001', 'RM-002', 'RM-003']
+    assert sorted(index.ancestors('RM-001')) == ['RM-002', 'RM-003']
+    assert index.descendant_count('RM-004') == 0
+
+
+def test_closure_decodes_dense_sets():
+    # More than 64 descendants takes the NumPy decoding path
+    G = nx.path_graph([f'RM-{i:03d}' for i in range(150)], create_using=nx.DiGraph)
+
+    index = ReachabilityIndex(G)
+
+    assert index.descendants('RM-000') == [f'RM-{i:03d}' for i in range(1, 150)]
+    assert index.ancestors('RM-149') == [f'RM-{i:03d}' for i in range(149)]
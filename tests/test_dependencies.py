@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from requirements_interactive import parse_dependencies, parse_dependency_column, parse_dependency_rows
+
+CELLS = {
+    'RM-100': 'RM-001..RM-003; RM-010',
+    'RM-101': 'RM-5, RM-002 .. RM-004',
+    'RM-102': '—',
+    'RM-103': None,
+    'RM-104': 'RM-009..RM-007',
+    'RM-105': 'RM-002, RM-002',
+    'RM-106': 'RM-001..RM-002,RM-020..RM-021 y RM-030',
+}
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('RM-012', ['RM-012']),
+    ('RM-001..RM-003; RM-010', ['RM-001', 'RM-002', 'RM-003', 'RM-010']),
+    ('RM-010, RM-001..RM-002, RM-020..RM-021', ['RM-010', 'RM-001', 'RM-002', 'RM-020', 'RM-021']),
+    ('RM-002 .. RM-004', ['RM-002', 'RM-003', 'RM-004']),
+    ('RM-009..RM-007', []),
+    ('—', []),
+    ('', []),
+    (None, []),
+])
+def test_parse_dependencies(cell, expected):
+    assert parse_dependencies(cell) == expected
+
+
+def test_parse_dependency_column_edge_table():
+    df = pd.DataFrame({'ID': list(CELLS), 'Dependencias': list(CELLS.values())})
+
+    edges = parse_dependency_column(df)
+
+    assert list(edges.itertuples(index=False, name=None)) == [
+        ('RM-001', 'RM-100', 'range'), ('RM-002', 'RM-100', 'range'), ('RM-003', 'RM-100', 'range'),
+        ('RM-010', 'RM-100', 'list'),
+        # Single references keep their spelling; ranges are zero-padded
+        ('RM-5', 'RM-101', 'list'), ('RM-002', 'RM-101', 'range'), ('RM-003', 'RM-101', 'range'),
+        ('RM-004', 'RM-101', 'range'),
+        ('RM-002', 'RM-105', 'list'),
+        ('RM-001', 'RM-106', 'range'), ('RM-002', 'RM-106', 'range'), ('RM-020', 'RM-106', 'range'),
+        ('RM-021', 'RM-106', 'range'), ('RM-030', 'RM-106', 'list'),
+    ]
+
+
+def test_column_and_row_parsers_agree():
+    df = pd.DataFrame({'ID': list(CELLS), 'Dependencias': list(CELLS.values())})
+    rows = [{'ID': req_id, 'Dependencias': cell} for req_id, cell in CELLS.items()]
+
+    edges = parse_dependency_column(df)
+
+    assert list(zip(edges['source'], edges['target'])) == parse_dependency_rows(rows)
+
+
+def test_parse_dependency_column_without_references():
+    df = pd.DataFrame({'ID': ['RM-001', 'RM-002'], 'Dependencias': ['—', None]})
+
+    edges = parse_dependency_column(df)
+
+    assert edges.empty
+    assert list(edges.columns) == ['source', 'target', 'kind']
@@ -0,0 +1,70 @@
+import csv
+import shutil
+from pathlib import Path
+
+import pytest
+
+from requirements_interactive import main
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / 'requirements_matrix_v3_2_es_schema_updated_myfxbook_metatrader.csv'
+
+
+def read_rows(path: Path) -> list:
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def write_rows(path: Path, rows: list):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def row(rows: list, req_id: str) -> dict:
+    return next(r for r in rows if r['ID'] == req_id)
+
+
+@pytest.fixture
+def matrix(tmp_path):
+    path = tmp_path / 'matrix.csv'
+    shutil.copyfile(SAMPLE_CSV, path)
+    return path
+
+
+def assert_incremental_build_matches_full(matrix: Path, tmp_path: Path, capsys) -> str:
+    """Build ``matrix`` with the cache, then from scratch; returns the cached build's output."""
+    cache_dir = tmp_path / 'cache'
+    main([str(matrix), '-o', str(tmp_path / 'incremental.html'), '--no-daemon', '--cache-dir', str(cache_dir)])
+    output = capsys.readouterr().out
+    main([str(matrix), '-o', str(tmp_path / 'full.html'), '--no-daemon', '--no-cache'])
+    capsys.readouterr()
+    assert (tmp_path / 'incremental.html').read_bytes() == (tmp_path / 'full.html').read_bytes()
+    return output
+
+
+def test_incremental_builds_match_full_builds(matrix, tmp_path, capsys):
+    output = assert_incremental_build_matches_full(matrix, tmp_path, capsys)
+    assert 'Reused previous analysis' not in output
+
+    # One row's text: every analysis result and every other node's fragment is reused
+    rows = read_rows(matrix)
+    row(rows, 'RM-010')['Funcionalidad'] = 'Funcionalidad editada'
+    write_rows(matrix, rows)
+    output = assert_incremental_build_matches_full(matrix, tmp_path, capsys)
+    assert 'Reused previous analysis (0 node(s) with changed dependencies)' in output
+
+    # One edge: levels and cycles are recomputed, the closure only where it can change
+    rows = read_rows(matrix)
+    row(rows, 'RM-020')['Dependencias'] += ', RM-054'
+    write_rows(matrix, rows)
+    output = assert_incremental_build_matches_full(matrix, tmp_path, capsys)
+    assert 'Reused previous analysis' in output
+    assert 'Reused previous analysis (0 node(s)' not in output
+
+    # The node list: nothing from the previous analysis applies
+    rows = read_rows(matrix)
+    rows = [r for r in rows if r['ID'] != 'RM-055']
+    write_rows(matrix, rows)
+    output = assert_incremental_build_matches_full(matrix, tmp_path, capsys)
+    assert 'Reused previous analysis' not in output
@@ -0,0 +1,49 @@
+import random
+
+import networkx as nx
+import pytest
+
+from requirements_interactive import calculate_hierarchical_levels
+
+
+def reference_levels(G: nx.DiGraph) -> dict:
+    """Longest-path levels on the SCC condensation, by repeated edge relaxation."""
+    C = nx.condensation(G)
+    level = dict.fromkeys(C, 0)
+    for _ in range(len(C)):
+        for u, v in C.edges():
+            level[v] = max(level[v], level[u] + 1)
+    return {node: level[C.graph['mapping'][node]] for node in G}
+
+
+def test_levels_are_longest_paths():
+    # RM-004 is reachable in one step from the root and in three along the chain
+    G = nx.DiGraph([('RM-001', 'RM-002'), ('RM-002', 'RM-003'), ('RM-003', 'RM-004'), ('RM-001', 'RM-004')])
+    G.add_node('RM-005')
+
+    assert calculate_hierarchical_levels(G) == {'RM-001': 0, 'RM-002': 1, 'RM-003': 2, 'RM-004': 3, 'RM-005': 0}
+
+
+def test_cycle_members_share_a_level():
+    G = nx.DiGraph([('RM-001', 'RM-002'), ('RM-002', 'RM-003'), ('RM-003', 'RM-002'), ('RM-003', 'RM-004'),
+                    ('RM-004', 'RM-004')])
+
+    assert calculate_hierarchical_levels(G) == {'RM-001': 0, 'RM-002': 1, 'RM-003': 1, 'RM-004': 2}
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_levels_match_reference_and_ignore_insertion_order(seed):
+    G = nx.gnp_random_graph(80, 0.015, seed=seed, directed=True)
+    G = nx.relabel_nodes(G, {i: f'RM-{i:03d}' for i in G})
+    shuffled = nx.DiGraph()
+    nodes, edges = list(G.nodes()), list(G.edges())
+    random.Random(seed).shuffle(nodes)
+    random.Random(seed).shuffle(edges)
+    shuffled.add_nodes_from(nodes)
+    shuffled.add_edges_from(edges)
+
+    levels = calculate_hierarchical_levels(G)
+
+    assert levels == reference_levels(G)
+    assert calculate_hierarchical_levels(shuffled) == levels
+    assert calculate_hierarchical_levels(G, nx.condensation(G)) == levels